@@ -1,58 +1,136 @@
 import configparser
+import io
 import os
+from contextlib import contextmanager
 
 class ConfigManager:
     def __init__(self, config_file, default_settings):
         self.config_file = config_file
         self.default_settings = default_settings
+        # Parsed settings kept in memory, re-read only when the file changes on disk
+        self._config = None
+        self._mtime_ns = None
+        # Settings waiting to be written, flushed once per batch
+        self._dirty = {}
+        self._in_batch = False
 
-    def save_setting(self, key, value):
-        config = configparser.ConfigParser()
-        if os.path.exists(self.config_file):
-            config.read(self.config_file)
+    def _get_config(self):
+        """Return the cached ConfigParser, re-parsing the file if it changed"""
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if self._config is None or mtime_ns != self._mtime_ns:
+            config = configparser.ConfigParser()
+            if mtime_ns is not None:
+                config.read(self.config_file)
+            self._config = config
+            self._mtime_ns = mtime_ns
+        return self._config
+
+    def _write_config(self, config):
+        """Write config to disk atomically and remember the resulting mtime"""
+        # Serialize in memory so the file gets a single write
+        buf = io.StringIO()
+        config.write(buf)
+        # Write to a per-process temp file and rename it over the target, so a crash never leaves a torn file
+        tmp_file = f"{self.config_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                f.write(buf.getvalue())
+            os.replace(tmp_file, self.config_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        self._config = config
+        self._mtime_ns = os.stat(self.config_file).st_mtime_ns
+
+    def _flush(self):
+        """Write all pending settings to disk in a single pass"""
+        if not self._dirty:
+            return
+        config = self._get_config()
         if "Settings" not in config:
             config["Settings"] = {}
-        config["Settings"][key] = str(value)
-        with open(self.config_file, "w") as f:
-            config.write(f)
+        for key, value in self._dirty.items():
+            config["Settings"][key] = str(value)
+        self._dirty.clear()
+        self._write_config(config)
+
+    def save_setting(self, key, value):
+        self._dirty[key] = value
+        if not self._in_batch:
+            self._flush()
+
+    def save_settings(self, settings):
+        """Save several settings with a single file write"""
+        self._dirty.update(settings)
+        if not self._in_batch:
+            self._flush()
+
+    def defer_setting(self, key, value):
+        """Queue a setting without writing it, the next flush() persists it"""
+        self._dirty[key] = value
+
+    def flush(self):
+        """Write deferred settings to disk, unless a batch is still open"""
+        if not self._in_batch:
+            self._flush()
+
+    @contextmanager
+    def batch(self):
+        """Defer writes made inside the block and flush them once on exit"""
+        if self._in_batch:
+            # Nested batch, the outermost one flushes
+            yield self
+            return
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self._flush()
 
     def load_setting(self, key, default=None):
-        config = configparser.ConfigParser()
-        if os.path.exists(self.config_file):
-            config.read(self.config_file)
-            return config.get("Settings", key, fallback=default)
-        return default
+        if key in self._dirty:
+            return str(self._dirty[key])
+        return self._get_config().get("Settings", key, fallback=default)
 
     def initialize_settings(self):
         """Initialize settings file with defaults if it doesn't exist"""
         config_dir = os.path.dirname(self.config_file)
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-        
-        if not os.path.exists(self.config_file):
-            config = configparser.ConfigParser()
+        if config_dir:
+            os.makedirs(config_dir, exist_ok=True)
+
+        # Open directly instead of checking existence first, and prime the cache from the same handle
+        config = configparser.ConfigParser()
+        try:
+            with open(self.config_file) as f:
+                config.read_file(f)
+                self._mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            self._config = config
+        except FileNotFoundError:
             config["Settings"] = {}
             # Convert all default values to strings
             for key, value in self.default_settings.items():
                 config["Settings"][key] = str(value)
-            with open(self.config_file, "w") as f:
-                config.write(f)
+            self._write_config(config)
             return True
-        
+
         # Ensure all default settings exist
-        config = configparser.ConfigParser()
-        config.read(self.config_file)
         if "Settings" not in config:
             config["Settings"] = {}
-        
+
         updated = False
         for key, value in self.default_settings.items():
             if key not in config["Settings"]:
                 config["Settings"][key] = str(value)  # Convert to string for ConfigParser
                 updated = True
-                
+
         if updated:
-            with open(self.config_file, "w") as f:
-                config.write(f)
-                
+            self._write_config(config)
+
         return updated
\ No newline at end of file
@@ -1,185 +1,482 @@
+import functools
+import importlib
+import importlib.util
+import inspect
 import logging
+import os
+import queue
+import random
+import sys
 import threading
 import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 
-# Import RPM monitor with fallback for packaging
-try:
-    from .rpm_monitor import RPMMonitor
-except ImportError:
-    from rpm_monitor import RPMMonitor
+# HID bindings and the RPM monitor are imported on first use, so code paths that
+# never touch the device don't pay for loading the native libraries
+_hid = None
+_hidapi = None
+_hid_loaded = False
+_hidapi_loaded = False
+_rpm_monitor_cls = None
 
-# Try different ways to import hidapi
-try:
-    import hid
-except ImportError:
+def _import_first(*names):
+    """Import the first of names that is installed, probing with find_spec instead of catching ImportError"""
+    for name in names:
+        if importlib.util.find_spec(name) is None:
+            continue
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            # Found but not loadable, e.g. the shared hidapi library is missing
+            continue
+    return None
+
+def _get_hid():
+    """Return the hid module, importing it once on first use"""
+    global _hid, _hid_loaded
+    if not _hid_loaded:
+        # Using the cffi hidapi module in place of hid is opt-in, its API only partly matches
+        if os.environ.get('BS2PRO_USE_HIDAPI') == '1':
+            _hid = _import_first('hid', 'hidapi')
+        else:
+            _hid = _import_first('hid')
+        _hid_loaded = True
+    return _hid
+
+def _get_hidapi():
+    """Return the hidapi module for direct low-level access, importing it only when first needed"""
+    global _hidapi, _hidapi_loaded
+    if not _hidapi_loaded:
+        _hidapi = _import_first('hidapi')
+        _hidapi_loaded = True
+    return _hidapi
+
+def _hidapi_installed():
+    """Check whether direct hidapi access is available without importing it"""
+    if _hidapi_loaded:
+        return _hidapi is not None
+    return importlib.util.find_spec('hidapi') is not None
+
+def _get_rpm_monitor_cls():
+    """Import the RPMMonitor class on first use"""
+    global _rpm_monitor_cls
+    if _rpm_monitor_cls is None:
+        # Relative import when loaded as part of the package, top-level module when run from the source dir
+        if __package__:
+            module = importlib.import_module('.rpm_monitor', __package__)
+        else:
+            module = importlib.import_module('rpm_monitor')
+        _rpm_monitor_cls = module.RPMMonitor
+    return _rpm_monitor_cls
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_bytes(hex_cmd):
+    """Decode a hex command string, cached since the command set is small and fixed (bytes are immutable, safe to share)"""
+    return bytes.fromhex(hex_cmd)
+
+@functools.lru_cache(maxsize=64)
+def _hex_batch_to_bytes(hex_cmds):
+    """Decode a tuple of hex commands into a tuple of payloads, so repeated batches reuse the same objects"""
+    return tuple(_hex_to_bytes(hex_cmd) for hex_cmd in hex_cmds)
+
+def _retry_delay(attempt):
+    """Exponential backoff with a little jitter: ~10, 20, 40, 80 ms for attempts 0-3"""
+    return 0.01 * (2 ** attempt) + random.uniform(0, 0.005)
+
+# hid.enumerate() walks the whole USB bus, so bursts of detections share one scan
+ENUMERATE_TTL = 2.0
+# How long a detected device is trusted without an open handle before rescanning
+DETECT_TTL = 3.0
+_enum_cache = {"t": 0.0, "v": None}
+
+def _enumerate_cached(ttl=ENUMERATE_TTL):
+    """Return hid.enumerate() results, rescanning at most once per ttl seconds"""
+    now = time.monotonic()
+    if _enum_cache["v"] is None or now - _enum_cache["t"] > ttl:
+        devices = _get_hid().enumerate()
+        # Convert generator to list if needed (some hidapi versions return generators)
+        if not isinstance(devices, list):
+            devices = list(devices)
+        _enum_cache["v"] = devices
+        _enum_cache["t"] = now
+    return _enum_cache["v"]
+
+# Known Flydigi vendor IDs (can be extended if needed)
+FLYDIGI_VENDOR_IDS = frozenset([
+    0x37d7,  # Flydigi vendor ID
+])
+
+# Upper-cased needles for the product/manufacturer string heuristics
+BS2_PRODUCT_NEEDLE = "BS2"
+FLYDIGI_MANUFACTURER_NEEDLE = "FLYDIGI"
+
+# Detection heuristics are scored per device and the best match wins:
+#   4 - product string contains "BS2" (catches BS2, BS2PRO, BS2 Pro, etc.)
+#   2 - manufacturer contains "Flydigi"
+#   1 - known Flydigi vendor ID, for devices that don't expose product/manufacturer strings
+SCORE_BS2_PRODUCT = 4
+SCORE_FLYDIGI_MANUFACTURER = 2
+SCORE_FLYDIGI_VENDOR = 1
+
+def _match_reason(score):
+    """Return (reason, log level) describing how a device with this score was matched"""
+    if score >= SCORE_BS2_PRODUCT:
+        return "by product name", logging.INFO
+    if score >= SCORE_FLYDIGI_MANUFACTURER:
+        # Very permissive, logs warning
+        return "by manufacturer only - may be incorrect", logging.WARNING
+    return "by vendor ID only - strings unavailable", logging.INFO
+
+def _fmt_ids(vid, pid):
+    """Format vendor/product IDs as 0x-prefixed hex for log messages"""
+    return (f"0x{vid:04x}" if isinstance(vid, int) else str(vid),
+            f"0x{pid:04x}" if isinstance(pid, int) else str(pid))
+
+# VID/PID pairs known to be a BS2Pro, checked before the string heuristics.
+# Only product name matches are added, a weaker manufacturer or vendor ID match could be another
+# Flydigi device and must not shadow the real BS2Pro on later rescans.
+KNOWN_BS2PRO_IDS = set()
+# VID/PID pairs that scored nothing, skipped without any string work on later rescans.
+# Cleared whenever detection is invalidated (hotplug or open failure), since a freshly plugged
+# device may not report its strings yet.
+NON_BS2PRO_IDS = set()
+
+def _dict_device_fields(d):
+    """Return (product, manufacturer, vendor_id, product_id, path) for a dictionary-style device entry"""
+    return (d.get("product_string") or "", d.get("manufacturer_string") or "",
+            d.get("vendor_id"), d.get("product_id"), d.get("path"))
+
+def _attr_device_fields(d):
+    """Return (product, manufacturer, vendor_id, product_id, path) for an attribute-style device entry"""
+    return (getattr(d, 'product_string', '') or "", getattr(d, 'manufacturer_string', '') or "",
+            getattr(d, 'vendor_id', None), getattr(d, 'product_id', None), getattr(d, 'path', None))
+
+# Set once the HID library details have been logged, so repeated controllers stay quiet
+_hid_logged = False
+
+def _invalidate_enumeration():
+    """Force the next _enumerate_cached() call to rescan the bus"""
+    _enum_cache["v"] = None
+    _enum_cache["t"] = 0.0
+
+# hidapi API shape, resolved once per process instead of on every command
+_openers = None
+_read_response = None
+
+# Fan commands are fire-and-forget, responses are only read when a caller expects a reply.
+# Unread acknowledgements are consumed (and ignored) by the RPM monitor's report reads.
+REPLY_TIMEOUT_MS = 50
+
+def _resolve_openers():
+    """Build the open methods supported by the installed hidapi binding, in order of preference"""
+    openers = []
+    hid = _get_hid()
+    if hid is None:
+        return openers
+
+    # Method 0: device() constructor with path (most reliable for BS2Pro)
+    if hasattr(hid, 'device'):
+        def open_by_path(vid, pid, device_path):
+            if not device_path:
+                return None
+            dev = hid.device()
+            dev.open_path(device_path)
+            return dev
+        openers.append(("device() + open_path()", open_by_path))
+
+    # Method 1: direct hidapi low-level access, only imported if the path open failed
+    if _hidapi_installed():
+        def open_direct(vid, pid, device_path):
+            hidapi = _get_hidapi()
+            if hidapi is None:
+                return None
+            device_handle = hidapi.hidapi.hid_open(vid, pid, hidapi.ffi.NULL)
+            if device_handle == hidapi.ffi.NULL:
+                return None
+            return {'handle': device_handle, 'type': 'direct'}
+        openers.append(("direct hidapi access", open_direct))
+
+    # Method 2: hid.open() function
+    if hasattr(hid, 'open'):
+        openers.append(("hid.open()", lambda vid, pid, device_path: hid.open(vid, pid)))
+
+    # Method 3: device().open() (traditional approach)
+    if hasattr(hid, 'device'):
+        def open_by_ids(vid, pid, device_path):
+            dev = hid.device()
+            dev.open(vid, pid)
+            return dev
+        openers.append(("device().open()", open_by_ids))
+
+    # Skip the Device class as it's broken on this system
+    return openers
+
+def _get_openers():
+    """Return the cached open methods for the installed hidapi binding"""
+    global _openers
+    if _openers is None:
+        _openers = _resolve_openers()
+    return _openers
+
+# Index of the open method that last succeeded, tried first since it rarely changes on a host
+_preferred_opener = None
+
+def _open_hid(vid, pid, device_path):
+    """Open the device with the first working method, returning (device, method name) or (None, None)"""
+    global _preferred_opener
+    openers = _get_openers()
+    order = range(len(openers))
+    if _preferred_opener is not None:
+        order = [_preferred_opener] + [i for i in order if i != _preferred_opener]
+    for i in order:
+        method_name, opener = openers[i]
+        try:
+            dev = opener(vid, pid, device_path)
+        except Exception as e:
+            logging.debug("%s failed: %s", method_name, e)
+            continue
+        if dev is not None:
+            _preferred_opener = i
+            return dev, method_name
+    return None, None
+
+def _resolve_read_response(dev):
+    """Pick the response read call for this binding from the read() signature"""
     try:
-        import hidapi as hid
-    except ImportError:
-        hid = None
-
-# Also try to import hidapi directly for low-level access
-try:
-    import hidapi
-    HIDAPI_DIRECT = True
-except ImportError:
-    hidapi = None
-    HIDAPI_DIRECT = False
+        params = inspect.signature(dev.read).parameters
+    except (TypeError, ValueError):
+        # Compiled bindings may not expose a signature, probe the timeout argument on the first read instead
+        def probe(d, timeout_ms):
+            global _read_response
+            try:
+                data = d.read(32, timeout_ms)
+                _read_response = lambda d, timeout_ms: d.read(32, timeout_ms)
+                return data
+            except TypeError:
+                # Some versions don't support timeout parameter
+                _read_response = lambda d, timeout_ms: d.read(32)
+                return d.read(32)
+        return probe
+    # Timeout passed positionally, the keyword is timeout_ms in cython-hidapi and timeout elsewhere
+    if len(params) >= 2:
+        return lambda d, timeout_ms: d.read(32, timeout_ms)
+    return lambda d, timeout_ms: d.read(32)
+
+def _read_hid_report(dev, timeout_ms):
+    """Read one 32-byte report, using read(32) alone on bindings whose read() takes no timeout"""
+    global _read_response
+    if _read_response is None:
+        _read_response = _resolve_read_response(dev)
+    return _read_response(dev, timeout_ms)
 
 class BS2ProController:
-    def __init__(self):
-        # Collect HID library metadata (keep logs concise)
-        self.hid_info = {
-            'available': hid is not None,
-            'module': getattr(hid, '__name__', None) if hid is not None else None,
-            'location': getattr(hid, '__file__', None) if hid is not None else None,
-            'version': getattr(hid, '__version__', None) if hid is not None else None,
-            'direct_hidapi': HIDAPI_DIRECT,
-        }
+    # Field accessor for enumerated devices, resolved from the first entry since the
+    # shape is fixed by the installed hidapi binding
+    _device_info_extractor = None
 
-        if self.hid_info['available']:
-            # Keep this at DEBUG level so normal startup stays concise
-            logging.debug(
-                f"HID library available: module={self.hid_info['module']} "
-                f"version={self.hid_info['version'] or 'unknown'} "
-                f"location={self.hid_info['location'] or 'unknown'}"
-            )
-        else:
-            logging.warning("HID library not available")
-        
-        # Initialize RPM monitor with shared device access
-        self.rpm_monitor = RPMMonitor()
+    def __init__(self):
+        # HID library details and the RPM monitor are resolved on first access
+        self._hid_info = None
+        self._rpm_monitor = None
         self.shared_device = None
-        self.device_lock = threading.Lock()
-        self.rpm_monitor.set_shared_device_access(self._get_shared_device, self._release_shared_device)
+        # Close method of the shared device, resolved when it is opened
+        self._shared_device_close = None
+        # Path and product string of the last opened device, used to reopen it without enumerating
+        self._last_device_path = None
+        self._last_device_product = None
+        # Scratch buffer for direct hidapi response reads
+        self._response_buffer = None
+        # Re-entrant so device creation and release can run inside an I/O session
+        self.device_lock = threading.RLock()
+
+        # Last successful detection as one (vid, pid, path) tuple, so readers never see a half-updated value.
+        # Reused until opening or talking to the device fails.
+        self._cached_device = None
+        self._cached_device_ts = 0.0
+        # udev observer that invalidates detection on plug events, started on first detection (Linux + pyudev only)
+        self._hotplug_observer = None
+        self._hotplug_checked = False
+        # FIFO of (hex_cmds, status_callback, expect_reply, future) drained by a worker thread started on first use
+        self._cmd_queue = queue.SimpleQueue()
+        self._cmd_worker = None
+
+    @property
+    def hid_info(self):
+        """HID library metadata, collected (and logged once per process) on first access"""
+        if self._hid_info is None:
+            hid = _get_hid()
+            # Collect HID library metadata (keep logs concise)
+            self._hid_info = {
+                'available': hid is not None,
+                'module': getattr(hid, '__name__', None) if hid is not None else None,
+                'location': getattr(hid, '__file__', None) if hid is not None else None,
+                'version': getattr(hid, '__version__', None) if hid is not None else None,
+                'direct_hidapi': _hidapi_installed(),
+            }
+
+            # Log the HID library details once per process, and only if DEBUG is enabled
+            global _hid_logged
+            if not _hid_logged:
+                _hid_logged = True
+                if not self._hid_info['available']:
+                    logging.warning("HID library not available")
+                elif logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(
+                        "HID library available: module=%s version=%s location=%s",
+                        self._hid_info['module'],
+                        self._hid_info['version'] or 'unknown',
+                        self._hid_info['location'] or 'unknown',
+                    )
+        return self._hid_info
+
+    @property
+    def rpm_monitor(self):
+        """RPM monitor with shared device access, created on first use"""
+        if self._rpm_monitor is None:
+            self._rpm_monitor = _get_rpm_monitor_cls()()
+            self._rpm_monitor.set_shared_device_access(self._get_shared_device, self._release_shared_device,
+                                                       self.device_lock)
+        return self._rpm_monitor
 
     def detect_bs2pro(self):
-        if hid is None:
+        """Return (vid, pid, path) of the BS2Pro, enumerating only when not cached"""
+        if not self._hotplug_checked:
+            self._start_hotplug_monitor()
+        cached = self._cached_device
+        # An open handle proves the device is still there, and with udev events the result stays valid
+        # until a plug event arrives. Otherwise trust the result for DETECT_TTL.
+        if cached is not None and (self.shared_device is not None or self._hotplug_observer is not None
+                                   or time.monotonic() - self._cached_device_ts < DETECT_TTL):
+            return cached
+
+        vid, pid, device_path = self._enumerate_bs2pro()
+        if vid is not None and pid is not None:
+            self._cached_device = (vid, pid, device_path)
+            self._cached_device_ts = time.monotonic()
+        else:
+            self._cached_device = None
+        return vid, pid, device_path
+
+    def get_detected_device(self):
+        """Return (vid, pid, path) for status displays, safe to call from any thread"""
+        # The detection cache, enumeration cache and one-time hotplug setup are shared with
+        # _ensure_device, the command worker and the RPM monitor, so detect under the device lock.
+        # While the cached result is valid this returns it without enumerating.
+        with self.device_lock:
+            return self.detect_bs2pro()
+
+    def _invalidate_detection(self):
+        """Forget the cached device so the next detection re-enumerates"""
+        self._cached_device = None
+        NON_BS2PRO_IDS.clear()
+        _invalidate_enumeration()
+
+    def _start_hotplug_monitor(self):
+        """Watch udev hidraw events so detection is invalidated only when a device is plugged or unplugged"""
+        self._hotplug_checked = True
+        if not sys.platform.startswith('linux') or importlib.util.find_spec('pyudev') is None:
+            return
+        try:
+            pyudev = importlib.import_module('pyudev')
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('hidraw')
+            observer = pyudev.MonitorObserver(monitor, callback=self._on_hotplug_event, name='bs2pro-hotplug')
+            observer.daemon = True
+            observer.start()
+            self._hotplug_observer = observer
+            logging.debug("Watching udev hidraw events for device changes")
+        except Exception as e:
+            # Fall back to the TTL based detection cache
+            logging.debug("udev hotplug monitoring unavailable: %s", e)
+
+    def _on_hotplug_event(self, device):
+        """udev callback: drop cached detection results when a hidraw node appears or disappears"""
+        if device.action in ('add', 'remove'):
+            logging.debug("udev %s event for %s", device.action, device.device_node)
+            self._invalidate_detection()
+
+    def _enumerate_bs2pro(self):
+        """Scan all HID devices for the BS2Pro"""
+        if _get_hid() is None:
             logging.error("HID library not available")
             return None, None, None
-        
-        # Known Flydigi vendor IDs (can be extended if needed)
-        FLYDIGI_VENDOR_IDS = [
-            0x37d7,  # Flydigi vendor ID
-        ]
-        
+
         try:
-            devices = hid.enumerate()
-            # Convert generator to list if needed (some hidapi versions return generators)
-            if not isinstance(devices, list):
-                devices = list(devices)
-            logging.debug(f"Enumerating {len(devices)} HID devices...")
+            devices = _enumerate_cached()
+            logging.debug("Enumerating %d HID devices...", len(devices))
+            if not devices:
+                logging.debug("BS2Pro device not found in HID enumeration")
+                return None, None, None
+
+            # Handle both dictionary-style and attribute-style access for different hidapi versions
+            extract = BS2ProController._device_info_extractor
+            if extract is None:
+                extract = _dict_device_fields if isinstance(devices[0], dict) else _attr_device_fields
+                BS2ProController._device_info_extractor = extract
+
+            # Fast path: integer match against already known BS2Pro IDs
+            if KNOWN_BS2PRO_IDS:
+                for d in devices:
+                    _, _, vendor_id, product_id, device_path = extract(d)
+                    if (vendor_id, product_id) in KNOWN_BS2PRO_IDS:
+                        logging.debug("BS2Pro device matched known IDs: VID=0x%04x, PID=0x%04x", vendor_id, product_id)
+                        return vendor_id, product_id, device_path
+
+            # Flydigi vendor devices go first (stable sort, one integer test each), so the usual
+            # case returns before any string work is done on unrelated devices
+            devices = sorted(devices, key=lambda d: extract(d)[2] not in FLYDIGI_VENDOR_IDS)
+
+            debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+            best = None
+            best_score = 0
             for d in devices:
-                # Handle both dictionary-style and attribute-style access for different hidapi versions
-                product_string = ""
-                manufacturer_string = ""
-                vendor_id = None
-                product_id = None
-                device_path = None
-                
-                # Check if it's a dictionary (most common case)
-                if isinstance(d, dict):
-                    product_string = d.get("product_string", "")
-                    manufacturer_string = d.get("manufacturer_string", "")
-                    vendor_id = d.get("vendor_id")
-                    product_id = d.get("product_id")
-                    device_path = d.get("path")
-                else:
-                    # Try attribute access for object-style access
-                    try:
-                        product_string = getattr(d, 'product_string', '')
-                        manufacturer_string = getattr(d, 'manufacturer_string', '')
-                        vendor_id = getattr(d, 'vendor_id', None)
-                        product_id = getattr(d, 'product_id', None)
-                        device_path = getattr(d, 'path', None)
-                    except (AttributeError, TypeError):
-                        # Skip this device if we can't access its info
-                        continue
-                
-                # Normalize strings for comparison (case-insensitive)
-                product_upper = product_string.upper() if product_string else ""
-                manufacturer_upper = manufacturer_string.upper() if manufacturer_string else ""
-                
+                product_string, manufacturer_string, vendor_id, product_id, device_path = extract(d)
+                if (vendor_id, product_id) in NON_BS2PRO_IDS:
+                    continue
+
+                # Normalize strings for comparison (case-insensitive), skipping ones too short to match
+                product_upper = product_string.upper() if len(product_string) >= len(BS2_PRODUCT_NEEDLE) else ""
+                manufacturer_upper = (manufacturer_string.upper()
+                                      if len(manufacturer_string) >= len(FLYDIGI_MANUFACTURER_NEEDLE) else "")
+
                 # Log all devices in verbose mode for debugging
-                logging.debug(f"HID device: VID=0x{vendor_id:04x}, PID=0x{product_id:04x}, "
-                           f"manufacturer='{manufacturer_string}', product='{product_string}', path={device_path}")
-                
-                # Detection heuristics (in order of preference):
-                # 1. Product string contains "BS2" (catches BS2, BS2PRO, BS2 Pro, etc.)
-                # 2. Manufacturer is "Flydigi" AND product contains "BS2"
-                # 3. Manufacturer is "Flydigi" (fallback for any Flydigi device)
-                # 4. Vendor ID matches known Flydigi vendor IDs AND product contains "BS2"
-                
-                is_bs2_product = "BS2" in product_upper if product_upper else False
-                is_flydigi_manufacturer = "FLYDIGI" in manufacturer_upper if manufacturer_upper else False
-                is_flydigi_vendor = vendor_id in FLYDIGI_VENDOR_IDS if vendor_id is not None else False
-                
-                # Primary detection: Product name contains "BS2"
-                if is_bs2_product:
-                    try:
-                        vid_hex = f"0x{vendor_id:04x}" if vendor_id is not None else str(vendor_id)
-                        pid_hex = f"0x{product_id:04x}" if product_id is not None else str(product_id)
-                    except Exception:
-                        vid_hex = vendor_id
-                        pid_hex = product_id
-                    logging.info(f"BS2Pro device detected (by product name): VID={vid_hex}, PID={pid_hex}, "
-                               f"manufacturer='{manufacturer_string}', product='{product_string}', path={device_path}")
-                    return vendor_id, product_id, device_path
-                
-                # Secondary detection: Flydigi manufacturer + BS2 product
-                if is_flydigi_manufacturer and is_bs2_product:
-                    try:
-                        vid_hex = f"0x{vendor_id:04x}" if vendor_id is not None else str(vendor_id)
-                        pid_hex = f"0x{product_id:04x}" if product_id is not None else str(product_id)
-                    except Exception:
-                        vid_hex = vendor_id
-                        pid_hex = product_id
-                    logging.info(f"BS2Pro device detected (by manufacturer + product): VID={vid_hex}, PID={pid_hex}, "
-                               f"manufacturer='{manufacturer_string}', product='{product_string}', path={device_path}")
-                    return vendor_id, product_id, device_path
+                if debug_enabled:
+                    vid_hex, pid_hex = _fmt_ids(vendor_id, product_id)
+                    logging.debug("HID device: VID=%s, PID=%s, manufacturer=%r, product=%r, path=%s",
+                                  vid_hex, pid_hex, manufacturer_string, product_string, device_path)
                 
-                # Tertiary detection: Flydigi vendor ID + BS2 product (when manufacturer string unavailable)
-                if is_flydigi_vendor and is_bs2_product:
-                    try:
-                        vid_hex = f"0x{vendor_id:04x}" if vendor_id is not None else str(vendor_id)
-                        pid_hex = f"0x{product_id:04x}" if product_id is not None else str(product_id)
-                    except Exception:
-                        vid_hex = vendor_id
-                        pid_hex = product_id
-                    logging.info(f"BS2Pro device detected (by vendor ID + product): VID={vid_hex}, PID={pid_hex}, "
-                               f"manufacturer='{manufacturer_string}', product='{product_string}', path={device_path}")
-                    return vendor_id, product_id, device_path
-                
-                # Last resort: Flydigi manufacturer only (very permissive, logs warning)
-                if is_flydigi_manufacturer:
-                    try:
-                        vid_hex = f"0x{vendor_id:04x}" if vendor_id is not None else str(vendor_id)
-                        pid_hex = f"0x{product_id:04x}" if product_id is not None else str(product_id)
-                    except Exception:
-                        vid_hex = vendor_id
-                        pid_hex = product_id
-                    logging.warning(f"BS2Pro device detected (by manufacturer only - may be incorrect): "
-                                  f"VID={vid_hex}, PID={pid_hex}, manufacturer='{manufacturer_string}', "
-                                  f"product='{product_string}', path={device_path}")
-                    return vendor_id, product_id, device_path
-                
-                # Final fallback: Flydigi vendor ID only (when strings are empty/unavailable)
-                # This handles cases where HID device doesn't expose product/manufacturer strings
-                if is_flydigi_vendor and vendor_id is not None and product_id is not None:
-                    try:
-                        vid_hex = f"0x{vendor_id:04x}" if vendor_id is not None else str(vendor_id)
-                        pid_hex = f"0x{product_id:04x}" if product_id is not None else str(product_id)
-                    except Exception:
-                        vid_hex = vendor_id
-                        pid_hex = product_id
-                    logging.info(f"BS2Pro device detected (by vendor ID only - strings unavailable): "
-                               f"VID={vid_hex}, PID={pid_hex}, manufacturer='{manufacturer_string}', "
-                               f"product='{product_string}', path={device_path}")
-                    return vendor_id, product_id, device_path
-            
+                score = 0
+                if product_upper and BS2_PRODUCT_NEEDLE in product_upper:
+                    score += SCORE_BS2_PRODUCT
+                if manufacturer_upper and FLYDIGI_MANUFACTURER_NEEDLE in manufacturer_upper:
+                    score += SCORE_FLYDIGI_MANUFACTURER
+                if vendor_id in FLYDIGI_VENDOR_IDS and vendor_id is not None and product_id is not None:
+                    score += SCORE_FLYDIGI_VENDOR
+
+                if score == 0 and vendor_id is not None and product_id is not None:
+                    NON_BS2PRO_IDS.add((vendor_id, product_id))
+                elif score > best_score:
+                    best_score = score
+                    best = (product_string, manufacturer_string, vendor_id, product_id, device_path)
+                    # Nothing ranks above a product name match, stop scanning
+                    if score >= SCORE_BS2_PRODUCT:
+                        break
+
+            if best is not None:
+                product_string, manufacturer_string, vendor_id, product_id, device_path = best
+                if best_score >= SCORE_BS2_PRODUCT:
+                    KNOWN_BS2PRO_IDS.add((vendor_id, product_id))
+                reason, level = _match_reason(best_score)
+                vid_hex, pid_hex = _fmt_ids(vendor_id, product_id)
+                logging.log(level, "BS2Pro device detected (%s): VID=%s, PID=%s, manufacturer=%r, product=%r, path=%s",
+                            reason, vid_hex, pid_hex, manufacturer_string, product_string, device_path)
+                return vendor_id, product_id, device_path
+
             logging.debug("BS2Pro device not found in HID enumeration")
             return None, None, None
         except Exception as e:
-            logging.error(f"Error enumerating HID devices: {e}")
+            logging.error("Error enumerating HID devices: %s", e)
             return None, None, None
 
     def startup_summary(self):
@@ -189,6 +486,9 @@ class BS2ProController:
         while surfacing the most important bits (HID availability and
         detected device info).
         """
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+
         lines = []
         lines.append("Application startup summary:")
         lines.append(f"  HID library: {'available' if self.hid_info['available'] else 'missing'}")
@@ -197,14 +497,14 @@ class BS2ProController:
             lines.append(f"    version: {self.hid_info['version'] or 'unknown'}")
             if self.hid_info['location']:
                 lines.append(f"    location: {self.hid_info['location']}")
-        lines.append(f"  HIDAPI direct available: {HIDAPI_DIRECT}")
+        lines.append(f"  HIDAPI direct available: {self.hid_info['direct_hidapi']}")
 
-        vid, pid, path = self.detect_bs2pro()
+        # Report an earlier detection as-is, only enumerate if nothing has been detected yet
+        cached = self._cached_device
+        vid, pid, path = cached if cached is not None else self.detect_bs2pro()
         if vid is not None and pid is not None:
-            try:
-                lines.append(f"  BS2Pro device: VID=0x{vid:04x}, PID=0x{pid:04x}")
-            except Exception:
-                lines.append(f"  BS2Pro device: VID={vid}, PID={pid}")
+            vid_hex, pid_hex = _fmt_ids(vid, pid)
+            lines.append(f"  BS2Pro device: VID={vid_hex}, PID={pid_hex}")
             if path:
                 lines.append(f"    path: {path}")
         else:
@@ -212,246 +512,295 @@ class BS2ProController:
 
         logging.info('\n'.join(lines))
 
-    def send_command(self, hex_cmd, status_callback=None):
-        if hid is None:
+    def _transfer(self, dev, payloads, expect_reply=False):
+        """Write a burst of commands to an open device, reading one response per command if expected"""
+        # Handle direct hidapi access
+        if isinstance(dev, dict) and dev.get('type') == 'direct':
+            hidapi = _get_hidapi()
+            if hidapi is not None:
+                for payload in payloads:
+                    bytes_written = hidapi.hidapi.hid_write(dev['handle'], payload, len(payload))
+                    logging.debug("HID write: %s bytes", bytes_written)
+                if expect_reply:
+                    # Responses are discarded, so one buffer is reused for every read
+                    if self._response_buffer is None:
+                        self._response_buffer = hidapi.ffi.new("unsigned char[]", 32)
+                    for _ in payloads:
+                        hidapi.hidapi.hid_read_timeout(dev['handle'], self._response_buffer, 32, REPLY_TIMEOUT_MS)
+            return
+
+        # Regular hidapi device: submit all writes back-to-back, then consume the responses
+        for payload in payloads:
+            dev.write(payload)
+        if expect_reply:
+            for _ in payloads:
+                _read_hid_report(dev, REPLY_TIMEOUT_MS)
+
+    def _set_nonblocking(self, dev):
+        """Put a freshly opened device in non-blocking mode, so reads without a timeout never hang"""
+        try:
+            if isinstance(dev, dict) and dev.get('type') == 'direct':
+                hidapi = _get_hidapi()
+                if hidapi is not None and hasattr(hidapi.hidapi, 'hid_set_nonblocking'):
+                    hidapi.hidapi.hid_set_nonblocking(dev['handle'], 1)
+            elif hasattr(dev, 'set_nonblocking'):
+                dev.set_nonblocking(1)
+        except Exception as e:
+            logging.debug("Could not enable non-blocking mode: %s", e)
+
+    def _resolve_close(self, dev):
+        """Return a no-argument callable that closes a device returned by one of the openers"""
+        if isinstance(dev, dict) and dev.get('type') == 'direct':
+            hidapi = _get_hidapi()
+            if hidapi is None:
+                return lambda: None
+            def close_direct():
+                hidapi.hidapi.hid_close(dev['handle'])
+                logging.debug("Direct hidapi device closed")
+            return close_direct
+        return getattr(dev, 'close', lambda: None)
+
+    def send_command(self, hex_cmd, status_callback=None, expect_reply=False):
+        """Send a single hex command to the device"""
+        return self.send_commands([hex_cmd], status_callback=status_callback, expect_reply=expect_reply)
+
+    def send_commands(self, hex_cmds, status_callback=None, expect_reply=False):
+        """Send several hex commands in one burst, taking the device lock once.
+
+        Responses are not read unless expect_reply is set, in which case
+        each command waits up to REPLY_TIMEOUT_MS for its reply.
+        """
+        if _get_hid() is None:
             if status_callback:
                 status_callback("❌ HID library not available", "danger")
             logging.error("HID library not available")
             return False
-            
+
+        try:
+            payloads = _hex_batch_to_bytes(tuple(hex_cmds))
+        except ValueError as e:
+            if status_callback:
+                status_callback(f"⚠️ Invalid command: {e}", "danger")
+            logging.error("Invalid command: %s", e)
+            return False
+
         # Retry logic for device access conflicts
         for attempt in range(5):
             try:
-                # Use shared device if available, otherwise create temporary one
-                dev = self._get_shared_device()
-                if dev:
-                    logging.debug("Using shared device for command")
-                    payload = bytes.fromhex(hex_cmd)
-                    
-                    # Handle direct hidapi access
-                    if isinstance(dev, dict) and dev.get('type') == 'direct':
-                        if HIDAPI_DIRECT:
-                            # Write the command
-                            bytes_written = hidapi.hidapi.hid_write(dev['handle'], payload, len(payload))
-                            if bytes_written > 0:
-                                # Read response
-                                response_buffer = hidapi.ffi.new("unsigned char[]", 32)
-                                bytes_read = hidapi.hidapi.hid_read_timeout(dev['handle'], response_buffer, 32, 1000)
-                                logging.debug(f"HID write: {bytes_written} bytes, read: {bytes_read} bytes")
-                    else:
-                        # Regular hidapi device
-                        dev.write(payload)
-                        # Try with timeout first, fallback to without timeout
+                # Every command goes through the persistent shared handle
+                with self._device_session() as (dev, detected):
+                    if dev:
+                        logging.debug("Using shared device for command")
                         try:
-                            dev.read(32, timeout=1000)
-                        except TypeError:
-                            # Some versions don't support timeout parameter
-                            dev.read(32)
-                else:
-                    # Fallback to creating temporary device
-                    vid, pid, device_path = self.detect_bs2pro()
-                    if vid is None or pid is None:
+                            self._transfer(dev, payloads, expect_reply)
+                        except Exception:
+                            # Drop the broken handle so the next attempt reopens it
+                            self._release_shared_device()
+                            raise
+                if not dev:
+                    if not detected:
                         if status_callback:
                             status_callback("❌ BS2PRO device not found", "danger")
                         logging.error("BS2PRO device not found.")
                         return False
-                    
-                    # Try different hidapi APIs based on version, starting with most compatible
-                    device_opened = False
-                    
-                    # Method 0: Try device() constructor with path (most reliable for BS2Pro)
-                    if hasattr(hid, 'device') and device_path and not device_opened:
-                        try:
-                            dev = hid.device()
-                            dev.open_path(device_path)
-                            device_opened = True
-                            payload = bytes.fromhex(hex_cmd)
-                            dev.write(payload)
-                            # Try without timeout since this hidapi version doesn't support it
-                            try:
-                                dev.read(32)
-                            except Exception:
-                                pass  # Read may not be necessary for command sending
-                            dev.close()
-                            logging.debug("Used device() + open_path() successfully")
-                        except Exception as e:
-                            logging.debug(f"device() + open_path() failed: {e}")
-                    
-                    # Method 1: Try direct hidapi low-level access
-                    if HIDAPI_DIRECT and not device_opened:
-                        try:
-                            device_handle = hidapi.hidapi.hid_open(vid, pid, hidapi.ffi.NULL)
-                            if device_handle != hidapi.ffi.NULL:
-                                device_opened = True
-                                payload = bytes.fromhex(hex_cmd)
-                                # Write the command
-                                bytes_written = hidapi.hidapi.hid_write(device_handle, payload, len(payload))
-                                if bytes_written > 0:
-                                    # Read response
-                                    response_buffer = hidapi.ffi.new("unsigned char[]", 32)
-                                    bytes_read = hidapi.hidapi.hid_read_timeout(device_handle, response_buffer, 32, 1000)
-                                    logging.debug(f"HID write: {bytes_written} bytes, read: {bytes_read} bytes")
-                                hidapi.hidapi.hid_close(device_handle)
-                                logging.debug("Used direct hidapi low-level access successfully")
-                        except Exception as e:
-                            logging.debug(f"Direct hidapi access failed: {e}")
-                    
-                    # Method 2: Try hid.open() function
-                    if hasattr(hid, 'open') and not device_opened:
-                        try:
-                            dev = hid.open(vid, pid)
-                            if dev is not None:
-                                device_opened = True
-                                payload = bytes.fromhex(hex_cmd)
-                                dev.write(payload)
-                                # Try with timeout first, fallback to without timeout
-                                try:
-                                    dev.read(32, timeout=1000)
-                                except TypeError:
-                                    # Some versions don't support timeout parameter
-                                    dev.read(32)
-                                dev.close()
-                        except Exception as e:
-                            logging.debug(f"hid.open() failed: {e}")
-                    
-                    # Method 3: Try device().open() (traditional approach)
-                    if hasattr(hid, 'device') and not device_opened:
-                        try:
-                            dev = hid.device()
-                            dev.open(vid, pid)
-                            device_opened = True
-                            payload = bytes.fromhex(hex_cmd)
-                            dev.write(payload)
-                            # Try with timeout first, fallback to without timeout
-                            try:
-                                dev.read(32, timeout=1000)
-                            except TypeError:
-                                # Some versions don't support timeout parameter
-                                dev.read(32)
-                            dev.close()
-                        except Exception as e:
-                            logging.debug(f"hid.device().open() failed: {e}")
-                    
-                    # Skip Method 4 (Device class) as it's broken on this system
-                    
-                    if not device_opened:
-                        if attempt < 4:  # Don't log error on last attempt
-                            logging.debug(f"Failed to create shared HID device with any method, retrying in 200ms (attempt {attempt + 1}/5)")
-                            time.sleep(0.2)
-                            continue
-                        else:
-                            if status_callback:
-                                status_callback("❌ Failed to open HID device", "danger")
-                            logging.error("All HID device opening methods failed")
-                            return False
-                
+
+                    # Detected but not openable (busy or permissions), _ensure_device already
+                    # dropped the cached detection so the next attempt enumerates again
+                    if attempt < 4:  # Don't log error on last attempt
+                        delay = _retry_delay(attempt)
+                        logging.debug("Failed to create shared HID device with any method, retrying in %.0fms (attempt %d/5)", delay * 1000, attempt + 1)
+                        time.sleep(delay)
+                        continue
+                    else:
+                        if status_callback:
+                            status_callback("❌ Failed to open HID device", "danger")
+                        logging.error("All HID device opening methods failed")
+                        return False
+
                 if status_callback:
                     status_callback("✅ Command sent successfully", "success")
-                logging.info(f"Command sent: {hex_cmd}")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    for hex_cmd in hex_cmds:
+                        logging.info("Command sent: %s", hex_cmd)
                 return True
             except Exception as e:
                 if attempt < 4:  # Don't log error on last attempt
-                    logging.debug(f"Shared device not available, retrying in 200ms (attempt {attempt + 1}/5)")
-                    time.sleep(0.2)
+                    delay = _retry_delay(attempt)
+                    logging.debug("Shared device not available, retrying in %.0fms (attempt %d/5)", delay * 1000, attempt + 1)
+                    time.sleep(delay)
                     continue
                 else:
                     if status_callback:
                         status_callback(f"⚠️ HID error: {e}", "danger")
-                    logging.error(f"HID error: {e}")
+                    logging.error("HID error: %s", e)
                     return False
     
+    def send_command_async(self, hex_cmd, status_callback=None, expect_reply=False):
+        """Queue a single hex command for the worker thread, returning a Future with the send result"""
+        return self.send_commands_async([hex_cmd], status_callback=status_callback, expect_reply=expect_reply)
+
+    def send_commands_async(self, hex_cmds, status_callback=None, expect_reply=False):
+        """Queue several hex commands for the worker thread, returning a Future with the send result.
+
+        Commands are sent in submission order. status_callback runs on the
+        worker thread, so GUI callers must marshal it back themselves.
+        """
+        future = Future()
+        self._cmd_queue.put((list(hex_cmds), status_callback, expect_reply, future))
+        if self._cmd_worker is None:
+            with self.device_lock:
+                if self._cmd_worker is None:
+                    self._cmd_worker = threading.Thread(target=self._command_worker, name="bs2pro-commands",
+                                                        daemon=True)
+                    self._cmd_worker.start()
+        return future
+
+    def _command_worker(self):
+        """Send queued commands in submission order, draining everything queued so far per wake-up"""
+        while True:
+            item = self._cmd_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            # Drain whatever else was queued meanwhile so a burst is handled in one pass
+            while True:
+                try:
+                    item = self._cmd_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._cmd_queue.put(None)
+                    break
+                batch.append(item)
+            # No outer device lock: send_commands takes it per transfer through _device_session,
+            # so retry back-off and status callbacks never lock out the RPM monitor
+            for hex_cmds, status_callback, expect_reply, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self.send_commands(hex_cmds, status_callback, expect_reply))
+                except Exception as e:
+                    future.set_exception(e)
+
+    @contextmanager
+    def _device_session(self):
+        """Yield (shared device or None, detected) with the lock held only for the I/O inside the block"""
+        # Serialize access with the RPM monitor, hidapi handles are not thread-safe
+        with self.device_lock:
+            yield self._ensure_device()
+
     def _get_shared_device(self):
         """Get shared HID device for both reading and writing"""
+        return self._ensure_device()[0]
+
+    def _ensure_device(self):
+        """Return (shared device, detected), detecting and opening the device with at most one enumeration.
+
+        detected tells a device that was found but could not be opened
+        apart from one that is not connected, so callers never rescan.
+        """
+        # Double-checked locking: reading the reference is atomic under the GIL, so an open
+        # handle is returned without touching the lock; only creation is serialized
+        dev = self.shared_device
+        if dev is not None:
+            return dev, True
         with self.device_lock:
+            # Another thread may have opened the device while we waited for the lock
             if self.shared_device is None:
                 try:
+                    dev = self._reopen_last_path()
+                    if dev is not None:
+                        self._set_nonblocking(dev)
+                        self._shared_device_close = self._resolve_close(dev)
+                        self.shared_device = dev
+                        logging.debug("Reopened shared device at %s without enumeration", self._last_device_path)
+                        return dev, True
+
                     vid, pid, device_path = self.detect_bs2pro()
                     if vid is None or pid is None:
-                        return None
+                        return None, False
                     
-                    logging.debug(f"Creating shared HID device VID={vid:04x}, PID={pid:04x}")
+                    logging.debug("Creating shared HID device VID=%04x, PID=%04x", vid, pid)
                     if device_path:
-                        logging.debug(f"Device path: {device_path}")
+                        logging.debug("Device path: %s", device_path)
                     
-                    # Try different hidapi APIs, starting with most compatible
-                    device_created = False
-                    
-                    # Method 0: Try device() constructor with path (most reliable for BS2Pro)
-                    if hasattr(hid, 'device') and device_path and not device_created:
-                        try:
-                            self.shared_device = hid.device()
-                            self.shared_device.open_path(device_path)
-                            device_created = True
-                            logging.debug("Created shared device with device() + open_path()")
-                        except Exception as e:
-                            logging.debug(f"device() + open_path() failed: {e}")
-                    
-                    # Method 1: Try direct hidapi low-level access
-                    if HIDAPI_DIRECT and not device_created:
-                        try:
-                            device_handle = hidapi.hidapi.hid_open(vid, pid, hidapi.ffi.NULL)
-                            if device_handle != hidapi.ffi.NULL:
-                                # For shared device, we'll store the handle differently
-                                self.shared_device = {'handle': device_handle, 'type': 'direct'}
-                                device_created = True
-                                logging.debug("Created shared device with direct hidapi access")
-                        except Exception as e:
-                            logging.debug(f"Direct hidapi access failed: {e}")
-                    
-                    # Method 2: Try hid.open() function
-                    if hasattr(hid, 'open') and not device_created:
-                        try:
-                            self.shared_device = hid.open(vid, pid)
-                            if self.shared_device is not None:
-                                device_created = True
-                                logging.debug("Created shared device with hid.open()")
-                        except Exception as e:
-                            logging.debug(f"hid.open() failed: {e}")
-                    
-                    # Method 3: Try device().open() (traditional approach)
-                    if hasattr(hid, 'device') and not device_created:
-                        try:
-                            self.shared_device = hid.device()
-                            self.shared_device.open(vid, pid)
-                            device_created = True
-                            logging.debug("Created shared device with device().open()")
-                        except Exception as e:
-                            logging.debug(f"hid.device().open() failed: {e}")
-                            self.shared_device = None
-                    
-                    # Skip Method 3 (Device class) as it's broken on this system
-                    
-                    if not device_created or self.shared_device is None:
+                    dev, method_name = _open_hid(vid, pid, device_path)
+                    if dev is None:
                         logging.error("Failed to create shared HID device with any method")
-                        return None
+                        # Cached device info may be stale, enumerate again on the next attempt
+                        self._invalidate_detection()
+                        return None, True
                     
-                    logging.debug("Shared HID device created successfully")
+                    self._set_nonblocking(dev)
+                    # Publish the handle last, lock-free readers must never see it without its close method
+                    self._shared_device_close = self._resolve_close(dev)
+                    self.shared_device = dev
+                    logging.debug("Created shared device with %s", method_name)
+                    self._remember_device_path(dev, device_path)
                 except Exception as e:
-                    logging.error(f"Error creating shared HID device: {e}")
-                    return None
+                    logging.error("Error creating shared HID device: %s", e)
+                    return None, True
             
-            return self.shared_device
+            return self.shared_device, True
     
+    def _remember_device_path(self, dev, device_path):
+        """Record the path and product string of an opened device for _reopen_last_path()"""
+        self._last_device_path = None
+        self._last_device_product = None
+        if not device_path or not hasattr(dev, 'get_product_string'):
+            return
+        try:
+            product = dev.get_product_string()
+        except Exception as e:
+            logging.debug("Could not read product string: %s", e)
+            return
+        if product:
+            self._last_device_path = device_path
+            self._last_device_product = product
+
+    def _reopen_last_path(self):
+        """Open the last known device path directly, skipping enumeration.
+
+        hidraw nodes are reused after a replug, so the product string is
+        checked to make sure the path still belongs to the BS2Pro.
+        """
+        device_path = self._last_device_path
+        hid = _get_hid()
+        if not device_path or hid is None or not hasattr(hid, 'device'):
+            return None
+        dev = hid.device()
+        try:
+            dev.open_path(device_path)
+            if dev.get_product_string() == self._last_device_product:
+                return dev
+            logging.debug("Device at %s is no longer the BS2Pro", device_path)
+        except Exception as e:
+            logging.debug("Reopening %s failed: %s", device_path, e)
+        try:
+            dev.close()
+        except Exception:
+            pass
+        self._last_device_path = None
+        self._last_device_product = None
+        return None
+
     def _release_shared_device(self):
-        """Release shared device (called when RPM monitoring stops)"""
+        """Close the shared device (called on I/O errors and when RPM monitoring stops)"""
         with self.device_lock:
             if self.shared_device:
                 try:
-                    # Handle direct hidapi access case
-                    if isinstance(self.shared_device, dict) and self.shared_device.get('type') == 'direct':
-                        if HIDAPI_DIRECT:
-                            hidapi.hidapi.hid_close(self.shared_device['handle'])
-                            logging.debug("Direct hidapi shared device closed")
-                    elif hasattr(self.shared_device, 'close'):
-                        self.shared_device.close()
+                    self._shared_device_close()
                     self.shared_device = None
+                    self._shared_device_close = None
                     logging.debug("Shared HID device released")
                 except Exception as e:
-                    logging.error(f"Error releasing shared HID device: {e}")
+                    logging.error("Error releasing shared HID device: %s", e)
+            # The device may have been unplugged, detect it again before the next open
+            self._invalidate_detection()
     
     def start_rpm_monitoring(self, callback=None):
         """Start monitoring RPM data from the device"""
-        logging.debug(f"start_rpm_monitoring called with callback: {callback is not None}")
+        logging.debug("start_rpm_monitoring called with callback: %s", callback is not None)
         if callback:
             self.rpm_monitor.add_callback(callback)
         self.rpm_monitor.start_monitoring()
@@ -459,7 +808,8 @@ class BS2ProController:
     
     def stop_rpm_monitoring(self):
         """Stop monitoring RPM data"""
-        self.rpm_monitor.stop_monitoring()
+        if self._rpm_monitor is not None:
+            self._rpm_monitor.stop_monitoring()
         logging.info("RPM monitoring stopped")
     
     def get_current_rpm(self):
@@ -469,4 +819,23 @@ class BS2ProController:
     def add_rpm_callback(self, callback):
         """Add a callback for RPM updates"""
         self.rpm_monitor.add_callback(callback)
+
+    def remove_rpm_callback(self, callback):
+        """Remove a callback for RPM updates"""
+        if self._rpm_monitor is not None:
+            self._rpm_monitor.remove_callback(callback)
+
+    def close(self):
+        """Stop RPM monitoring and close the persistent HID handle"""
+        if self._rpm_monitor is not None:
+            self._rpm_monitor.stop_monitoring()
+        if self._cmd_worker is not None:
+            # Let queued commands finish before the handle is closed
+            self._cmd_queue.put(None)
+            self._cmd_worker.join(timeout=2)
+            self._cmd_worker = None
+        if self._hotplug_observer is not None:
+            self._hotplug_observer.stop()
+            self._hotplug_observer = None
+        self._release_shared_device()
     
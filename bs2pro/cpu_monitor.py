@@ -3,19 +3,77 @@
 Temperature Monitoring Module
 Supports CPU, GPU, and other temperature sources
 """
+import glob
 import os
 import logging
+import select
 import subprocess
 import threading
 import time
 
+# NVML gives the NVIDIA temperature with a library call instead of spawning nvidia-smi
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+# Temperature changes smaller than this (°C) count as steady when backing off the poll interval
+STABLE_DELTA = 0.5
+# Upper bound (seconds) for the backed-off poll interval
+MAX_POLL_INTERVAL = 16
+# How long (seconds) a reading is reused for repeated queries of the same source
+TEMPERATURE_TTL = 0.5
+# Seconds a looping nvidia-smi may take to print its first reading before it is given up on
+NVIDIA_SMI_START_TIMEOUT = 5
+# Seconds between hwmon scans while no readable sensor has been found
+HWMON_RESCAN_INTERVAL = 30
+
 class TemperatureMonitor:
     def __init__(self, source="cpu"):
         self.source = source
         self.temperature = 0
         self.is_monitoring = False
         self.monitor_thread = None
-        self.callbacks = []
+        # Insertion-ordered registry, dict keys give O(1) add/remove
+        self.callbacks = {}
+        # Last reading per source as source -> (monotonic timestamp, temperature)
+        self._cache = {}
+        # Reader methods that last succeeded, so the fallback chains are only walked once
+        self._cpu_reader = None
+        self._gpu_reader = None
+        # sysfs files found by the first probe, read directly on later polls
+        self._sensor_paths = None
+        self._thermal_path = None
+        # Earliest monotonic time for the next hwmon scan after one found nothing
+        self._next_sensor_scan = 0.0
+        # Descriptors of those files, kept open and re-read from offset 0 each poll while monitoring
+        self._sensor_fds = {}
+        # Guards the descriptors between the loop thread and get_temperature() calls from the GUI thread
+        self._sensor_fds_lock = threading.Lock()
+        # GPU sensors, resolved on first read
+        self._amd_gpu_path = None
+        # Whether thermal_zone0 is the Raspberry Pi SoC sensor, checked on first use
+        self._is_raspberry_pi = None
+        self._nvml_handle = None  # False once NVML failed to initialize
+        # epoll set watching the cached sysfs descriptors for change notifications (Linux only),
+        # and the descriptors already offered to it
+        self._epoll = None
+        self._epoll_fds = set()
+        # Set by stop_monitoring() to end waits early; the pipe wakes an epoll wait the same way
+        self._stop_event = threading.Event()
+        self._wake_pipe = None
+        # Guards the wake pipe between stop_monitoring() writing to it and the loop thread closing it
+        self._wake_lock = threading.Lock()
+        self._has_nvidia_smi = True
+        # Looping nvidia-smi process used when NVML isn't available, and its latest reading
+        self._nvidia_smi_proc = None
+        self._nvidia_smi_temp = None
+        self._nvidia_smi_started = 0.0
+        # Poll interval (seconds) of the monitoring loop, also used as the nvidia-smi loop interval
+        self._poll_interval = 2
+        # udev observer flagging the cached sysfs paths stale when hwmon devices come or go (pyudev only)
+        self._hwmon_observer = None
+        self._sensors_stale = False
         
     def set_source(self, source):
         """Set the temperature source"""
@@ -23,16 +81,16 @@ class TemperatureMonitor:
         
     def add_callback(self, callback):
         """Add a callback function to be called when temperature changes"""
-        self.callbacks.append(callback)
+        self.callbacks[callback] = None
     
     def remove_callback(self, callback):
         """Remove a callback function"""
-        if callback in self.callbacks:
-            self.callbacks.remove(callback)
+        self.callbacks.pop(callback, None)
     
     def _notify_callbacks(self, temperature):
         """Notify all registered callbacks of temperature change"""
-        for callback in self.callbacks:
+        # Iterate a snapshot, callbacks may be added or removed from another thread meanwhile
+        for callback in list(self.callbacks):
             try:
                 callback(temperature)
             except Exception as e:
@@ -41,34 +99,42 @@ class TemperatureMonitor:
     def get_temperature(self):
         """Get current temperature based on selected source"""
         if self.source == "cpu":
-            return self.get_cpu_temperature()
+            return self._cached_reading("cpu", self.get_cpu_temperature)
         elif self.source == "gpu":
-            return self.get_gpu_temperature()
+            return self._cached_reading("gpu", self.get_gpu_temperature)
         elif self.source == "average":
-            return self.get_average_temperature()
+            return self._cached_reading("average", self.get_average_temperature)
         else:
             logging.warning(f"Unknown temperature source: {self.source}, using CPU")
-            return self.get_cpu_temperature()
+            return self._cached_reading("cpu", self.get_cpu_temperature)
+
+    def _cached_reading(self, source, read):
+        """Return the reading for source, calling read() only if the last one is older than TEMPERATURE_TTL"""
+        now = time.monotonic()
+        entry = self._cache.get(source)
+        if entry is not None and now - entry[0] < TEMPERATURE_TTL:
+            return entry[1]
+        value = read()
+        self._cache[source] = (now, value)
+        return value
     
     def get_cpu_temperature(self):
         """Get current CPU temperature"""
         try:
+            if self._sensors_stale:
+                self._reset_sensors()
+            # The method that worked last time is called directly, the full chain only runs if it fails
+            if self._cpu_reader is not None:
+                temp = self._cpu_reader()
+                if temp is not None:
+                    return temp
+
             # Try different methods to get CPU temperature
-            temp = self._try_hwmon()
-            if temp is not None:
-                return temp
-                
-            temp = self._try_thermal_zone()
-            if temp is not None:
-                return temp
-                
-            temp = self._try_sensors()
-            if temp is not None:
-                return temp
-                
-            temp = self._try_vcgencmd()
-            if temp is not None:
-                return temp
+            for reader in (self._try_hwmon, self._try_thermal_zone, self._try_raspberry_pi):
+                temp = reader()
+                if temp is not None:
+                    self._cpu_reader = reader
+                    return temp
                 
             # Fallback: return a default temperature
             logging.warning("Could not read CPU temperature, using default")
@@ -81,34 +147,34 @@ class TemperatureMonitor:
     def get_gpu_temperature(self):
         """Get current GPU temperature"""
         try:
-            # Try NVIDIA GPU first
-            temp = self._try_nvidia_smi()
-            if temp is not None:
-                return temp
-            
-            # Try AMD GPU
-            temp = self._try_amd_gpu()
-            if temp is not None:
-                return temp
+            if self._sensors_stale:
+                self._reset_sensors()
+            if self._gpu_reader is not None:
+                temp = self._gpu_reader()
+                if temp is not None:
+                    return temp
+
+            # Try NVIDIA GPU first, then AMD GPU
+            for reader in (self._try_nvidia_smi, self._try_amd_gpu):
+                temp = reader()
+                if temp is not None:
+                    self._gpu_reader = reader
+                    return temp
             
             # Fallback
             logging.warning("Could not read GPU temperature, using CPU temperature as fallback")
-            return self.get_cpu_temperature()
+            return self._cached_reading("cpu", self.get_cpu_temperature)
             
         except Exception as e:
             logging.error(f"Error reading GPU temperature: {e}")
-            return self.get_cpu_temperature()
+            return self._cached_reading("cpu", self.get_cpu_temperature)
     
     def get_average_temperature(self):
         """Get average temperature across CPU and GPU"""
         try:
-            # Temporarily get CPU temp
-            current_source = self.source
-            self.source = "cpu"
-            cpu_temp = self.get_temperature()
-            self.source = "gpu"
-            gpu_temp = self.get_temperature()
-            self.source = current_source  # Restore
+            # Read both sources through the cache instead of switching self.source
+            cpu_temp = self._cached_reading("cpu", self.get_cpu_temperature)
+            gpu_temp = self._cached_reading("gpu", self.get_gpu_temperature)
             
             if gpu_temp and gpu_temp > 0:
                 return (cpu_temp + gpu_temp) / 2
@@ -116,138 +182,376 @@ class TemperatureMonitor:
                 return cpu_temp
         except Exception as e:
             logging.error(f"Error calculating average temperature: {e}")
-            return self.get_temperature()  # Fallback to current source
+            return self._cached_reading("cpu", self.get_cpu_temperature)  # Fallback to CPU
     
     def _try_nvidia_smi(self):
         """Try to read NVIDIA GPU temperature"""
-        try:
-            result = subprocess.run(['nvidia-smi', '--query-gpu=temperature.gpu', '--format=csv,noheader,nounits'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                temp = float(result.stdout.strip())
+        if pynvml is not None and self._nvml_handle is not False:
+            try:
+                if self._nvml_handle is None:
+                    pynvml.nvmlInit()
+                    self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                temp = float(pynvml.nvmlDeviceGetTemperature(self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU))
                 if 20 <= temp <= 100:
                     return temp
-        except Exception:
+                return None
+            except Exception:
+                # No NVIDIA driver, don't retry NVML on every poll
+                self._nvml_handle = False
+        if not self._has_nvidia_smi:
+            return None
+        try:
+            proc = self._nvidia_smi_proc
+            if proc is None or proc.poll() is not None:
+                self._start_nvidia_smi_stream()
+                return None
+            temp = self._nvidia_smi_temp
+            if temp is None:
+                # Still waiting for the first line, never block the caller for it
+                if time.monotonic() - self._nvidia_smi_started > NVIDIA_SMI_START_TIMEOUT:
+                    # Hung without a reading, don't respawn it every poll
+                    self._stop_nvidia_smi_stream()
+                    self._has_nvidia_smi = False
+                return None
+            if 20 <= temp <= 100:
+                return temp
+        except FileNotFoundError:
+            # Not installed, stop trying to spawn it on every poll
+            self._has_nvidia_smi = False
+        except (OSError, subprocess.SubprocessError):
             pass
         return None
+
+    def _start_nvidia_smi_stream(self):
+        """Start nvidia-smi in loop mode, its readings arrive in the background"""
+        # One long-running process prints a line per poll interval, instead of paying its startup on every poll
+        loop_seconds = str(max(1, int(round(self._poll_interval))))
+        proc = subprocess.Popen(['nvidia-smi', '--query-gpu=temperature.gpu', '--format=csv,noheader,nounits',
+                                 '-i', '0', '-l', loop_seconds],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        self._nvidia_smi_proc = proc
+        self._nvidia_smi_temp = None
+        self._nvidia_smi_started = time.monotonic()
+        threading.Thread(target=self._read_nvidia_smi_stream, args=(proc,), daemon=True).start()
+
+    def _read_nvidia_smi_stream(self, proc):
+        """Keep the latest temperature printed by a looping nvidia-smi process"""
+        got_reading = False
+        for line in proc.stdout:
+            try:
+                self._nvidia_smi_temp = float(line.strip())
+            except ValueError:
+                continue
+            got_reading = True
+        if not got_reading and self._nvidia_smi_proc is proc:
+            # No GPU or driver: it exited without a reading, don't respawn it every poll
+            self._has_nvidia_smi = False
+
+    def _stop_nvidia_smi_stream(self):
+        """Terminate the looping nvidia-smi process"""
+        proc = self._nvidia_smi_proc
+        self._nvidia_smi_proc = None
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
     
     def _try_amd_gpu(self):
-        """Try to read AMD GPU temperature"""
+        """Try to read AMD GPU temperature from the amdgpu hwmon sensor"""
         try:
-            # Try rocm-smi for AMD GPUs
-            result = subprocess.run(['rocm-smi', '--showtemp'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'GPU' in line and '°C' in line:
-                        # Parse temperature from AMD output
-                        parts = line.split()
-                        for part in parts:
-                            if part.endswith('°C'):
-                                temp_str = part[:-2]
-                                try:
-                                    temp = float(temp_str)
-                                    if 20 <= temp <= 100:
-                                        return temp
-                                except ValueError:
-                                    continue
-        except Exception:
+            if self._amd_gpu_path is None:
+                # amdgpu exposes its edge temperature as temp1_input of the card's hwmon device
+                for temp_file_path in sorted(glob.glob("/sys/class/drm/card*/device/hwmon/hwmon*/temp1_input")):
+                    temp = self._read_sysfs_temp(temp_file_path)
+                    if 20 <= temp <= 100:
+                        self._amd_gpu_path = temp_file_path
+                        return temp
+                    self._close_sensor_fd(temp_file_path)
+                return None
+            temp = self._read_sysfs_temp(self._amd_gpu_path)
+            if 20 <= temp <= 100:
+                return temp
+        except OSError:
+            if self._amd_gpu_path is not None:
+                self._close_sensor_fd(self._amd_gpu_path)
+            self._amd_gpu_path = None
+        except ValueError:
             pass
         return None
     
     def _try_thermal_zone(self):
         """Try to read from thermal zone (Linux)"""
-        try:
-            thermal_files = [
-                "/sys/class/thermal/thermal_zone0/temp",
-                "/sys/class/thermal/thermal_zone1/temp",
-                "/sys/class/thermal/thermal_zone2/temp"
-            ]
-            
-            for thermal_file in thermal_files:
-                if os.path.exists(thermal_file):
-                    with open(thermal_file, 'r') as f:
-                        temp_millicelsius = int(f.read().strip())
-                        temp_celsius = temp_millicelsius / 1000.0
-                        # Skip thermal_zone0 as it's often not the CPU temperature
-                        if thermal_file != "/sys/class/thermal/thermal_zone0/temp" and 20 <= temp_celsius <= 100:
-                            return temp_celsius
-        except Exception:
-            pass
+        # Read the zone found by an earlier probe directly
+        if self._thermal_path is not None:
+            try:
+                temp_celsius = self._read_sysfs_temp(self._thermal_path)
+                if 20 <= temp_celsius <= 100:
+                    return temp_celsius
+                return None
+            except (OSError, ValueError):
+                # Zone disappeared, probe again
+                self._close_sensor_fd(self._thermal_path)
+                self._thermal_path = None
+
+        # Skip thermal_zone0 as it's often not the CPU temperature (the Pi reader handles it)
+        thermal_files = [
+            "/sys/class/thermal/thermal_zone1/temp",
+            "/sys/class/thermal/thermal_zone2/temp"
+        ]
+        
+        for thermal_file in thermal_files:
+            # Missing zones raise FileNotFoundError, no separate existence check
+            try:
+                temp_celsius = self._read_sysfs_temp(thermal_file)
+            except (OSError, ValueError):
+                self._close_sensor_fd(thermal_file)
+                continue
+            if 20 <= temp_celsius <= 100:
+                self._thermal_path = thermal_file
+                return temp_celsius
+            self._close_sensor_fd(thermal_file)
         return None
     
-    def _try_hwmon(self):
-        """Try to read from hwmon (Linux) - most reliable for CPU temperature"""
+    def _read_sysfs_temp(self, path):
+        """Read a sysfs temperature file in °C"""
+        return self._read_sysfs_millidegrees(path) / 1000.0
+
+    def _read_sysfs_millidegrees(self, path):
+        """Read a millidegree sysfs temperature file as an integer, through a descriptor kept open between polls"""
+        # Held across the read so no other thread closes the descriptor (and the number gets reused) meanwhile
+        with self._sensor_fds_lock:
+            fd = self._sensor_fds.get(path)
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY)
+                if not self.is_monitoring:
+                    # Nothing would close a cached descriptor after stop_monitoring(), read it once
+                    try:
+                        return int(os.pread(fd, 32, 0))
+                    finally:
+                        os.close(fd)
+                self._sensor_fds[path] = fd
+            # sysfs attributes regenerate their value when read from offset 0
+            return int(os.pread(fd, 32, 0))
+
+    def _close_sensor_fd(self, path):
+        """Close the cached descriptor of one sysfs file"""
+        with self._sensor_fds_lock:
+            fd = self._sensor_fds.pop(path, None)
+            if fd is not None:
+                # Closing the descriptor also drops it from the epoll set
+                self._epoll_fds.discard(fd)
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _reset_sensors(self):
+        """Forget every cached sysfs sensor so the next read probes again"""
+        self._sensors_stale = False
+        self._sensor_paths = None
+        self._next_sensor_scan = 0.0
+        self._thermal_path = None
+        self._amd_gpu_path = None
+        self._cpu_reader = None
+        self._gpu_reader = None
+        self._close_sensor_fds()
+
+    def _start_hwmon_observer(self):
+        """Watch udev hwmon events so cached sensor paths are rediscovered only when drivers change"""
         try:
-            hwmon_path = "/sys/class/hwmon"
-            if not os.path.exists(hwmon_path):
-                return None
-                
-            # Look for CPU temperature sensors
-            cpu_temps = []
-            for hwmon_dir in os.listdir(hwmon_path):
-                if hwmon_dir.startswith('hwmon'):
-                    hwmon_full_path = os.path.join(hwmon_path, hwmon_dir)
-                    for temp_file in os.listdir(hwmon_full_path):
-                        if temp_file.startswith('temp') and temp_file.endswith('_input'):
-                            temp_file_path = os.path.join(hwmon_full_path, temp_file)
+            import pyudev
+        except ImportError:
+            return
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('hwmon')
+            observer = pyudev.MonitorObserver(monitor, callback=self._on_hwmon_event, name='bs2pro-hwmon')
+            observer.daemon = True
+            observer.start()
+            self._hwmon_observer = observer
+        except Exception as e:
+            logging.debug("udev hwmon monitoring unavailable: %s", e)
+
+    def _on_hwmon_event(self, device):
+        """udev callback: mark the sensor cache stale, the reading thread resets it before its next read"""
+        logging.debug("udev %s event for hwmon device %s", device.action, device.sys_name)
+        self._sensors_stale = True
+
+    def _close_sensor_fds(self):
+        """Close all cached sysfs descriptors"""
+        for path in list(self._sensor_fds):
+            self._close_sensor_fd(path)
+
+    def _wait_for_change(self, timeout):
+        """Sleep up to timeout seconds, waking early if the kernel signals a sysfs sensor change"""
+        if self._epoll is None:
+            if not hasattr(select, 'epoll'):
+                self._stop_event.wait(timeout)
+                return
+            self._epoll = select.epoll()
+            with self._wake_lock:
+                self._wake_pipe = os.pipe()
+            self._epoll.register(self._wake_pipe[0], select.EPOLLIN)
+        if self._stop_event.is_set():
+            return
+        # Sensors that support it (trip points, hwmon alarms) raise EPOLLPRI, the others simply time out
+        with self._sensor_fds_lock:
+            for fd in self._sensor_fds.values():
+                if fd not in self._epoll_fds:
+                    # Remembered even if registration fails, so unsupported files aren't retried every tick
+                    self._epoll_fds.add(fd)
+                    try:
+                        self._epoll.register(fd, select.EPOLLPRI | select.EPOLLET)
+                    except OSError:
+                        continue
+        try:
+            # Edge-triggered, the next pread() from offset 0 re-arms the notification
+            self._epoll.poll(timeout)
+        except InterruptedError:
+            pass
+
+    def _close_epoll(self):
+        """Close the epoll set used by the monitoring loop"""
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+            with self._sensor_fds_lock:
+                self._epoll_fds.clear()
+        with self._wake_lock:
+            if self._wake_pipe is not None:
+                for fd in self._wake_pipe:
+                    os.close(fd)
+                self._wake_pipe = None
+
+    def _release_resources(self):
+        """Close the epoll set, cached sysfs descriptors and the nvidia-smi stream"""
+        self._close_epoll()
+        self._close_sensor_fds()
+        self._stop_nvidia_smi_stream()
+
+    def _discover_sensors(self):
+        """Find the readable hwmon temp*_input files, returns {path: celsius}"""
+        sensors = {}
+        try:
+            hwmon_dirs = os.scandir("/sys/class/hwmon")
+        except FileNotFoundError:
+            return sensors
+        # DirEntry carries the joined path, so no per-entry os.path.join or existence checks
+        with hwmon_dirs:
+            for hwmon_dir in hwmon_dirs:
+                if not hwmon_dir.name.startswith('hwmon'):
+                    continue
+                with os.scandir(hwmon_dir.path) as temp_files:
+                    for temp_file in temp_files:
+                        if temp_file.name.startswith('temp') and temp_file.name.endswith('_input'):
+                            # The descriptor opened for this first sample is the one later polls reuse
                             try:
-                                with open(temp_file_path, 'r') as f:
-                                    temp_raw = f.read().strip()
-                                    temp_celsius = float(temp_raw) / 1000.0
-                                    if 20 <= temp_celsius <= 100:  # Reasonable temperature range
-                                        cpu_temps.append(temp_celsius)
-                            except Exception:
+                                sensors[temp_file.path] = self._read_sysfs_temp(temp_file.path)
+                            except (OSError, ValueError):
+                                self._close_sensor_fd(temp_file.path)
                                 continue
+        return sensors
+
+    def _try_hwmon(self):
+        """Try to read from hwmon (Linux) - most reliable for CPU temperature"""
+        try:
+            if self._sensor_paths is None:
+                now = time.monotonic()
+                if now < self._next_sensor_scan:
+                    return None
+                # Walk sysfs once, later polls only read the sensors found here
+                sensors = self._discover_sensors()
+                if not sensors:
+                    # Nothing readable yet (e.g. driver still loading), scan again later rather than never
+                    self._next_sensor_scan = now + HWMON_RESCAN_INTERVAL
+                    return None
+                self._sensor_paths = list(sensors)
+                readings = sensors.values()
+            else:
+                # Hot path: integer millidegrees, converted to °C once for the result.
+                # Range is still checked per poll, a sensor that was cold at discovery may become valid later.
+                # A failing sensor only drops out of this poll, the others still count.
+                hottest = None
+                for temp_file_path in list(self._sensor_paths):
+                    try:
+                        millidegrees = self._read_sysfs_millidegrees(temp_file_path)
+                    except FileNotFoundError:
+                        # Gone (e.g. module unloaded), stop polling it; rediscover once none are left
+                        self._close_sensor_fd(temp_file_path)
+                        self._sensor_paths.remove(temp_file_path)
+                        if not self._sensor_paths:
+                            self._sensor_paths = None
+                        continue
+                    except OSError:
+                        # Transient read error, reopen the file on the next poll
+                        self._close_sensor_fd(temp_file_path)
+                        continue
+                    except ValueError:
+                        continue
+                    if 20000 <= millidegrees <= 100000 and (hottest is None or millidegrees > hottest):
+                        hottest = millidegrees
+                return hottest / 1000.0 if hottest is not None else None
+            cpu_temps = [t for t in readings if 20 <= t <= 100]  # Reasonable temperature range
             
             if cpu_temps:
                 # Return the highest temperature (likely CPU)
                 return max(cpu_temps)
-        except Exception:
+        except OSError:
+            # A sensor went away (e.g. module reload), rediscover on the next poll
+            for temp_file_path in self._sensor_paths or ():
+                self._close_sensor_fd(temp_file_path)
+            self._sensor_paths = None
+        except ValueError:
             pass
         return None
     
-    def _try_sensors(self):
-        """Try to read CPU temperature from sensors command"""
+    def _try_raspberry_pi(self):
+        """Try to read the SoC temperature (Raspberry Pi), the same value vcgencmd measure_temp reports"""
+        if self._is_raspberry_pi is None:
+            self._is_raspberry_pi = self._detect_raspberry_pi()
+        if not self._is_raspberry_pi:
+            # Elsewhere zone0 is usually acpitz or a chipset sensor, not the CPU
+            return None
         try:
-            result = subprocess.run(['sensors'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'Core 0' in line or 'Package id 0' in line or 'Tdie' in line:
-                        # Extract temperature from line like "Core 0: +45.0°C" or "Package id 0: +45.0°C"
-                        parts = line.split('+')
-                        if len(parts) > 1:
-                            temp_part = parts[1].split('°')[0]
-                            temp = float(temp_part)
-                            if 20 <= temp <= 100:
-                                return temp
-        except Exception:
+            # thermal_zone0 is skipped by _try_thermal_zone, but on the Pi it is the SoC sensor
+            temp = self._read_sysfs_temp("/sys/class/thermal/thermal_zone0/temp")
+            if 20 <= temp <= 100:
+                return temp
+        except OSError:
+            self._close_sensor_fd("/sys/class/thermal/thermal_zone0/temp")
+        except ValueError:
             pass
         return None
     
-    def _try_vcgencmd(self):
-        """Try to read from vcgencmd (Raspberry Pi)"""
+    def _detect_raspberry_pi(self):
+        """Check whether thermal_zone0 is the Raspberry Pi SoC sensor"""
         try:
-            result = subprocess.run(['vcgencmd', 'measure_temp'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                # Output format: "temp=45.0'C"
-                temp_str = result.stdout.strip()
-                if 'temp=' in temp_str:
-                    temp_part = temp_str.split('temp=')[1].split("'")[0]
-                    temp = float(temp_part)
-                    if 20 <= temp <= 100:
-                        return temp
-        except Exception:
+            with open("/sys/class/thermal/thermal_zone0/type") as f:
+                if f.read().strip() == "cpu-thermal":
+                    return True
+        except OSError:
             pass
-        return None
-    
+        try:
+            with open("/proc/device-tree/model") as f:
+                return f.read().startswith("Raspberry Pi")
+        except OSError:
+            return False
+
     def start_monitoring(self, interval=2):
         """Start monitoring temperature"""
         if self.is_monitoring:
             return
+        if self.monitor_thread is not None and self.monitor_thread.is_alive():
+            # A previous loop is still finishing its last read, let it release its resources first
+            self.monitor_thread.join()
             
         self.is_monitoring = True
+        self._poll_interval = interval
+        self._stop_event.clear()
+        if self._hwmon_observer is None:
+            self._start_hwmon_observer()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval,), daemon=True)
         self.monitor_thread.start()
         logging.info(f"Temperature monitoring started for source: {self.source}")
@@ -255,22 +559,53 @@ class TemperatureMonitor:
     def stop_monitoring(self):
         """Stop monitoring temperature"""
         self.is_monitoring = False
+        # Wake the loop out of its wait instead of letting the interval run out
+        self._stop_event.set()
+        with self._wake_lock:
+            if self._wake_pipe is not None:
+                try:
+                    os.write(self._wake_pipe[1], b'\0')
+                except OSError:
+                    pass
+        if self._hwmon_observer is not None:
+            self._hwmon_observer.stop()
+            self._hwmon_observer = None
         if self.monitor_thread:
+            # The loop thread releases the epoll set, descriptors and nvidia-smi stream itself on exit,
+            # so nothing is closed under a read it is still doing
             self.monitor_thread.join(timeout=1)
+            if self.monitor_thread.is_alive():
+                logging.debug("Temperature monitoring thread still finishing, it will clean up on exit")
+        else:
+            # Never started, only an nvidia-smi stream launched by a direct reading needs closing
+            self._release_resources()
         logging.info("Temperature monitoring stopped")
     
     def _monitor_loop(self, interval):
         """Main monitoring loop"""
-        while self.is_monitoring:
-            try:
-                temp = self.get_temperature()
-                if temp != self.temperature:
-                    self.temperature = temp
-                    self._notify_callbacks(temp)
-                time.sleep(interval)
-            except Exception as e:
-                logging.error(f"Error in temperature monitoring loop: {e}")
-                time.sleep(interval)
+        # Consecutive polls without a meaningful change, used to back off while the temperature is steady
+        stable_count = 0
+        try:
+            while self.is_monitoring:
+                try:
+                    temp = self.get_temperature()
+                    if abs(temp - self.temperature) < STABLE_DELTA:
+                        stable_count += 1
+                    else:
+                        stable_count = 0
+                    if temp != self.temperature:
+                        self.temperature = temp
+                        self._notify_callbacks(temp)
+                    if not self.is_monitoring:
+                        break
+                    # Double the interval for each steady poll (up to 8x), any real change snaps back to the base
+                    self._wait_for_change(min(interval * 2 ** min(stable_count, 3), MAX_POLL_INTERVAL))
+                except Exception as e:
+                    logging.error(f"Error in temperature monitoring loop: {e}")
+                    self._stop_event.wait(interval)
+        finally:
+            # Released here rather than in stop_monitoring(), which may return before this thread is done
+            self._release_resources()
     
     def get_cached_temperature(self):
         """Get the last known temperature"""
@@ -7,17 +7,41 @@ Provides native KDE/Plasma theme integration with Breeze theme support
 import sys
 import os
 import logging
+import threading
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QComboBox, QPushButton, QCheckBox, QGroupBox, QFrame, QSystemTrayIcon, QMenu, QMessageBox, QDialog, QScrollArea,
     QLineEdit, QSpinBox
 )
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal
+from PyQt6.QtCore import QFileSystemWatcher, QTimer, Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont, QPixmap, QAction, QColor, QMouseEvent
 
 # Import PyQtGraph for interactive plotting
 import pyqtgraph as pg
 
+# Settings changed again within this many milliseconds only send the final value to the device
+DEBOUNCE_MS = 150
+# Seconds between background device detections for the status display
+DEVICE_POLL_INTERVAL = 2
+# Milliseconds to collect setting changes before writing them to the config file in one go
+CONFIG_FLUSH_MS = 500
+# Milliseconds a command status message stays before the device status is shown again
+STATUS_RESET_MS = 2000
+# Fan speeds offered in the RPM combo boxes, and their display strings built once
+RPM_VALUES = [1300, 1700, 1900, 2100, 2400, 2700]
+RPM_STRINGS = [str(rpm) for rpm in RPM_VALUES]
+
+
+@lru_cache(maxsize=None)
+def bold_font(point_size=None):
+    """Return a bold QFont, built once per point size and shared by every label using it"""
+    font = QFont()
+    if point_size:
+        font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
 
 # Custom PlotWidget that properly handles mouse events
 class DraggablePlotWidget(pg.PlotWidget):
@@ -226,17 +250,6 @@ class TemperatureRPMGraph(QWidget):
             
             event.accept()
         
-    def load_default_points(self):
-        """Load default temperature points for each RPM level"""
-        # Create default temperature progression: 20°C, 35°C, 45°C, 55°C, 70°C, 85°C
-        default_temps = [20, 35, 45, 55, 70, 85]
-        
-        for rpm, temp in zip(self.available_rpms, default_temps):
-            self.points.append((temp, rpm))
-        
-        self.update_plot()
-        self.pointsChanged.emit()
-        
     def on_mouse_click(self, event):
         """Handle mouse clicks on the graph - now used for dragging points"""
         # Mouse clicks are handled by the scatter plot item for dragging
@@ -478,354 +491,70 @@ except ImportError:
     from smart_mode import SmartModeManager
 
 
-class SmartModeConfigDialog(QDialog):
-    """Smart Mode Configuration Dialog with Graph and Range modes"""
-    
-    def __init__(self, parent, smart_mode_manager):
-        super().__init__(parent)
-        self.smart_mode_manager = smart_mode_manager
-        self.range_widgets = []
-        self.init_ui()
-        
-    def init_ui(self):
-        """Initialize dialog UI"""
-        self.setWindowTitle("Smart Mode Configuration")
-        self.setModal(True)
-        self.resize(900, 700)  # Increased size for graph
-        
-        # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(6)
-        
-        # Title
-        title_label = QLabel("Fan Speed Configuration")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
-        
-        # Graph widget (only mode now)
-        self.graph_widget = TemperatureRPMGraph()
-        layout.addWidget(self.graph_widget)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        save_btn = QPushButton("Save Configuration")
-        save_btn.clicked.connect(self.save_configuration)
-        save_btn.setDefault(True)
-        button_layout.addWidget(save_btn)
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(button_layout)
-        
-        # Load existing ranges (after UI is fully set up)
-        try:
-            self.load_ranges()
-        except Exception as e:
-            logging.error(f"Error loading ranges: {e}")
-            # Continue without loading ranges
-            
-    def create_graph_mode_widget(self):
-        """Create the graph-based configuration widget"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # Instructions
-        instructions = QLabel("Click on the graph to add temperature/RPM points.\n"
-                             "Right-click points to remove them.\n"
-                             "The fan will interpolate between points.")
-        instructions.setStyleSheet("color: gray;")
-        instructions.setWordWrap(True)
-        layout.addWidget(instructions)
-        
-        # Create the graph widget
-        self.graph_widget = TemperatureRPMGraph()
-        layout.addWidget(self.graph_widget)
-        
-        # Connect graph changes to preview update
-        self.graph_widget.pointsChanged.connect(self.update_preview)
-        
-        return widget
-        
-    def create_range_mode_widget(self):
-        """Create the traditional range configuration widget"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        # Scroll area for ranges
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setMinimumHeight(300)
-        
-        # Widget inside scroll area
-        scroll_widget = QWidget()
-        self.ranges_layout = QVBoxLayout(scroll_widget)
-        self.ranges_layout.setSpacing(6)
-        
-        scroll_area.setWidget(scroll_widget)
-        layout.addWidget(scroll_area)
-        
-        # Control buttons
-        controls_layout = QHBoxLayout()
-        
-        add_btn = QPushButton("Add New Range")
-        add_btn.clicked.connect(self.add_new_range)
-        controls_layout.addWidget(add_btn)
-        
-        sort_btn = QPushButton("Sort Ranges")
-        sort_btn.clicked.connect(self.sort_ranges)
-        sort_btn.setToolTip("Sort temperature ranges by minimum temperature")
-        controls_layout.addWidget(sort_btn)
-        
-        validate_btn = QPushButton("Validate")
-        validate_btn.clicked.connect(self.validate_ranges)
-        validate_btn.setToolTip("Check if the current configuration is valid")
-        controls_layout.addWidget(validate_btn)
-        
-        controls_layout.addStretch()
-        layout.addLayout(controls_layout)
-        
-        return widget
-        
-            
-    def load_ranges(self):
-        """Load existing ranges into both graph and range widgets"""
-        # Load from smart mode manager
-        ranges = self.smart_mode_manager.temperature_ranges
-        
-        if ranges:
-            # Convert ranges to graph points
-            for range_data in ranges:
-                temp = (range_data['min_temp'] + range_data['max_temp']) / 2  # Use midpoint
-                rpm = range_data['rpm']
-                self.graph_widget.add_point(temp, rpm)
-                
-            # Also create range widgets for range mode
-            for range_data in ranges:
-                self.add_range_widget(range_data)
-        else:
-            # Add some default points for demonstration
-            self.graph_widget.add_point(40, 800)
-            self.graph_widget.add_point(60, 1200)
-            self.graph_widget.add_point(80, 1800)
-            
-        self.update_preview()
-        
-    def add_range_widget(self, range_data=None):
-        """Add a new range widget (for range mode)"""
-        if range_data is None:
-            range_data = {'temp_min': 0, 'temp_max': 0, 'rpm': 0}
-        
-        # Create a widget for this range
-        range_widget = QWidget()
-        range_layout = QHBoxLayout(range_widget)
-        
-        # Temperature range inputs
-        temp_min_label = QLabel("Min Temp (°C):")
-        temp_min_spin = QSpinBox()
-        temp_min_spin.setRange(0, 100)
-        temp_min_spin.setValue(range_data.get('temp_min', 0))
-        
-        temp_max_label = QLabel("Max Temp (°C):")
-        temp_max_spin = QSpinBox()
-        temp_max_spin.setRange(0, 100)
-        temp_max_spin.setValue(range_data.get('temp_max', 0))
-        
-        # RPM input
-        rpm_label = QLabel("RPM:")
-        rpm_spin = QSpinBox()
-        rpm_spin.setRange(0, 10000)
-        rpm_spin.setValue(range_data.get('rpm', 0))
-        
-        # Remove button
-        remove_btn = QPushButton("Remove")
-        remove_btn.clicked.connect(lambda: self.remove_range_widget(range_widget))
-        
-        # Add to layout
-        range_layout.addWidget(temp_min_label)
-        range_layout.addWidget(temp_min_spin)
-        range_layout.addWidget(temp_max_label)
-        range_layout.addWidget(temp_max_spin)
-        range_layout.addWidget(rpm_label)
-        range_layout.addWidget(rpm_spin)
-        range_layout.addWidget(remove_btn)
-        
-        # Add to range mode layout
-        self.ranges_layout.addWidget(range_widget)
-        
-        # Store references for saving
-        range_widget.temp_min_spin = temp_min_spin
-        range_widget.temp_max_spin = temp_max_spin
-        range_widget.rpm_spin = rpm_spin
-        
-    def remove_range_widget(self, range_widget):
-        """Remove a range widget from the range mode"""
-        range_widget.setParent(None)
-        range_widget.deleteLater()
-        
-    def add_new_range(self):
-        """Add new range in range mode"""
-        self.add_range_widget()
-        
-    def sort_ranges(self):
-        """Sort ranges in range mode"""
-        pass
-        
-    def validate_ranges(self):
-        """Validate ranges in range mode"""
-        pass
-        
-    def save_configuration(self):
-        """Save the configuration from current mode"""
-        try:
-            # Clear existing ranges
-            self.smart_mode_manager.temperature_ranges = []
-            
-            # Get ranges based on current mode
-            if self.mode_combo.currentData() == "graph":
-                ranges_data = self.graph_widget.get_ranges()
-            else:
-                # Get from range widgets
-                ranges_data = []
-                for widget_data in self.range_widgets:
-                    min_temp = widget_data['min_spin'].value()
-                    max_temp = widget_data['max_spin'].value()
-                    rpm = int(widget_data['rpm_combo'].currentText())
-                    description = widget_data['desc_edit'].text() or "Range"
-                    
-                    ranges_data.append({
-                        'min_temp': min_temp,
-                        'max_temp': max_temp,
-                        'rpm': rpm,
-                        'description': description
-                    })
-            
-            # Validate ranges
-            if not ranges_data:
-                QMessageBox.warning(self, "No Ranges", "Please add at least one temperature range.")
-                return
-                
-            # Check for overlaps (critical error)
-            for i in range(len(ranges_data) - 1):
-                if ranges_data[i]['max_temp'] > ranges_data[i + 1]['min_temp']:
-                    QMessageBox.warning(self, "Overlapping Ranges", 
-                                      "Temperature ranges cannot overlap. Please adjust the ranges.")
-                    return
-            
-            # Add ranges to smart mode manager
-            for range_data in ranges_data:
-                self.smart_mode_manager.add_temperature_range(
-                    range_data['min_temp'],
-                    range_data['max_temp'],
-                    range_data['rpm'],
-                    range_data['description']
-                )
-            
-            # Save configuration
-            self.smart_mode_manager.save_config()
-            
-            # Show success message
-            QMessageBox.information(self, "Success", 
-                                  f"Smart mode configuration saved with {len(ranges_data)} ranges!")
-            
-            # Accept dialog
-            self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save configuration: {e}")
-    
-    def update_preview(self):
-        """Update the configuration preview"""
-        try:
-            # Get ranges based on current mode
-            if self.mode_combo.currentData() == "graph":
-                ranges_data = self.graph_widget.get_ranges()
-            else:
-                ranges_data = []
-                for widget_data in self.range_widgets:
-                    min_temp = widget_data['min_spin'].value()
-                    max_temp = widget_data['max_spin'].value()
-                    rpm = int(widget_data['rpm_combo'].currentText())
-                    description = widget_data['desc_edit'].text() or f"Range {len(ranges_data)+1}"
-                    
-                    ranges_data.append({
-                        'min_temp': min_temp,
-                        'max_temp': max_temp,
-                        'rpm': rpm,
-                        'description': description
-                    })
-            
-            # Sort by temperature for preview
-            ranges_data.sort(key=lambda x: x['min_temp'])
-            
-            # Create preview text
-            preview_lines = ["Fan speed behavior preview:"]
-            
-            for i, range_data in enumerate(ranges_data):
-                temp_range = f"{range_data['min_temp']}°C - {range_data['max_temp']}°C"
-                preview_lines.append(f"• {temp_range}: {range_data['rpm']} RPM ({range_data['description']})")
-            
-            # Check for issues
-            critical_issues = []
-            warning_issues = []
-            
-            # Check for invalid ranges
-            for range_data in ranges_data:
-                if range_data['min_temp'] >= range_data['max_temp']:
-                    critical_issues.append("Invalid temperature range")
-                    break
-            
-            # Check for overlaps
-            for i in range(len(ranges_data) - 1):
-                if ranges_data[i]['max_temp'] > ranges_data[i + 1]['min_temp']:
-                    critical_issues.append("Overlapping ranges")
-                    break
-            
-            # Check RPM progression
-            for i in range(len(ranges_data) - 1):
-                if ranges_data[i]['rpm'] >= ranges_data[i + 1]['rpm']:
-                    warning_issues.append("RPM doesn't increase with temperature")
-                    break
-            
-            if critical_issues:
-                preview_lines.append("")
-                preview_lines.append("❌ Critical issues: " + ", ".join(critical_issues))
-                self.preview_label.setStyleSheet("color: #dc3545; font-style: italic;")
-            elif warning_issues:
-                preview_lines.append("")
-                preview_lines.append("⚠️ Warning: " + ", ".join(warning_issues))
-                self.preview_label.setStyleSheet("color: #ffc107; font-style: italic;")
-            else:
-                preview_lines.append("")
-                preview_lines.append("✅ Configuration looks good!")
-                self.preview_label.setStyleSheet("color: #28a745; font-style: italic;")
-            
-            self.preview_label.setText("\n".join(preview_lines))
-            
-        except Exception as e:
-            self.preview_label.setText(f"Error updating preview: {e}")
-            self.preview_label.setStyleSheet("color: #dc3545; font-style: italic;")
-
-
 class BS2ProQtGUI(QMainWindow):
     """Native PyQt6 GUI for BS2PRO Controller with KDE/Breeze theme integration"""
     
+    # Device commands run on the controller's worker thread; these deliver their
+    # status messages and results back on the GUI thread
+    command_status = pyqtSignal(str, str)
+    command_done = pyqtSignal(object, bool)
+    # Failure message of a command sent from a settings handler
+    command_failed = pyqtSignal(str)
+    # Emitted by the background device poller when the detected device changes
+    device_detected = pyqtSignal()
+    # Emitted by the RPM monitor thread with each RPM reported by the device
+    rpm_reported = pyqtSignal(object)
+    # Emitted by the temperature monitor thread when a new sample is waiting in _pending_temperature
+    temperature_pending = pyqtSignal()
+    
+    # Status message styles used by device operation callbacks
+    STATUS_COLORS = {
+        "success": "#28a745",
+        "danger": "#dc3545", 
+        "warning": "#ffc107",
+        "info": "#17a2b8",
+        "light": "#6c757d"
+    }
+    # Temperature source keys and their display names, shown on every temperature update
+    SOURCE_NAMES = {
+        "cpu": "CPU",
+        "gpu": "GPU", 
+        "average": "Average"
+    }
+    SOURCE_KEYS = {name: source for source, name in SOURCE_NAMES.items()}
+    
     def __init__(self, controller, config_manager, rpm_commands, commands, default_settings, icon_path=None):
         super().__init__()
+        self.command_status.connect(self.show_command_status)
+        self.command_done.connect(lambda on_done, success: on_done(success))
+        self.command_failed.connect(self.show_command_failure)
+        # Bound once and shared by every device operation instead of built per call
+        self.status_callback = self.command_status.emit
         
         # Store references
         self.controller = controller
         self.config_manager = config_manager
         self.rpm_commands = rpm_commands
+        # Combo text -> command, so a selection needs no int() round trip
+        self.rpm_commands_by_text = {str(rpm): cmd for rpm, cmd in rpm_commands.items()}
+        # Settings whose last command failed, always re-sent even if the saved value matches
+        self.failed_settings = set()
+        # Setting key -> (value -> (commands, value to save), failure message), used by apply_setting
+        self.setting_actions = {
+            "autostart": (lambda value: ([commands[f"autostart_{value.lower()}"]], value.lower()),
+                          "Failed to set autostart mode"),
+            "rpm_mode": (lambda checked: ([commands["rpm_on" if checked else "rpm_off"]], "on" if checked else "off"),
+                         "Failed to toggle RPM indicator"),
+            "start_when_powered": (lambda checked: ([commands["startwhenpowered_on"]] if checked
+                                                    else commands["startwhenpowered_off"], "on" if checked else "off"),
+                                   "Failed to toggle start when powered"),
+            "last_rpm": (lambda text: ([self.rpm_commands_by_text[text]], text), "Failed to set RPM: {}"),
+        }
         self.commands = commands
         self.default_settings = default_settings
         self.icon_path = icon_path
+        # Loaded once and shared by the window and the tray icon
+        self.app_icon = QIcon(icon_path) if icon_path and os.path.exists(icon_path) else None
         
         # Initialize monitoring components
         self.cpu_monitor = TemperatureMonitor()
@@ -834,9 +563,37 @@ class BS2ProQtGUI(QMainWindow):
         self.smart_mode_manager = SmartModeManager()
         self.current_rpm = None
         self.displayed_rpm = None  # Track what's currently displayed
+        self.displayed_device_rpm = None  # Last RPM reported by the device and shown in the label
         self.displayed_autostart = None  # Track autostart setting
         self.displayed_rpm_mode = None  # Track RPM mode setting
         self.displayed_start_powered = None  # Track start when powered setting
+        # Debounce timers and the calls they will run, keyed by setting
+        self._pending_timers = {}
+        self._pending_calls = {}
+        # Last (vid, pid, path) seen by the background device poller, read by the status display
+        self._device_cache = (None, None, None)
+        self._device_poll_stop = threading.Event()
+        # Latest temperature sample from the monitor thread and whether a GUI flush is queued for it
+        self._pending_temperature = None
+        self._temperature_scheduled = False
+        self._displayed_temp_key = None
+        # Colour currently applied to the status label
+        self._status_color = None
+        # Smart status currently shown and the last formatted range text, see set_smart_status and smart_range_text
+        self._smart_status = None
+        self._smart_range_key = None
+        self._smart_range_text = None
+        # Settings changed from the GUI are written to disk in one batch
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.timeout.connect(self.flush_config)
+        # Restores the device status after a command status message
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(self.update_device_status)
+        
+        # Smart mode configuration dialog, created on first use and reused afterwards
+        self.smart_mode_dialog = None
         
         # Initialize system tray
         self.tray_icon = None
@@ -861,8 +618,8 @@ class BS2ProQtGUI(QMainWindow):
         self.resize(450, 580)  # Increased height from 520 to 580
         
         # Set window icon
-        if self.icon_path and os.path.exists(self.icon_path):
-            self.setWindowIcon(QIcon(self.icon_path))
+        if self.app_icon:
+            self.setWindowIcon(self.app_icon)
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -900,10 +657,7 @@ class BS2ProQtGUI(QMainWindow):
     def create_header_section(self, parent_layout):
         """Create the header section with app title"""
         header_label = QLabel("BS2PRO Controller")
-        header_font = QFont()
-        header_font.setPointSize(14)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setFont(bold_font(14))
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_label.setStyleSheet("color: #2980b9; margin: 4px 0px;")  # Reduced margin
         parent_layout.addWidget(header_label)
@@ -916,9 +670,7 @@ class BS2ProQtGUI(QMainWindow):
         status_layout.setContentsMargins(10, 8, 10, 8)  # Increased padding
         
         self.status_label = QLabel("Device Status: Not Connected")
-        status_font = QFont()
-        status_font.setBold(True)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(bold_font())
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setStyleSheet("padding: 6px;")  # Increased padding for better text display
         
@@ -941,7 +693,8 @@ class BS2ProQtGUI(QMainWindow):
         self.autostart_combo = QComboBox()
         self.autostart_combo.addItems(["OFF", "Instant", "Delayed"])
         self.autostart_combo.setCurrentText(self.config_manager.load_setting("autostart", "off").title())
-        self.autostart_combo.currentTextChanged.connect(self.on_autostart_select)
+        # textActivated only fires on user selection, so programmatic updates need no signal blocking
+        self.autostart_combo.textActivated.connect(self.on_autostart_select)
         self.autostart_combo.setToolTip("Choose autostart behavior")
         self.autostart_combo.setMinimumWidth(140)  # Increased from 120
         self.autostart_combo.setMinimumHeight(24)  # Ensure proper height
@@ -954,14 +707,15 @@ class BS2ProQtGUI(QMainWindow):
         # RPM Indicator checkbox
         self.rpm_indicator_cb = QCheckBox("RPM Indicator")
         self.rpm_indicator_cb.setChecked(self.config_manager.load_setting("rpm_mode", "off") == "on")
-        self.rpm_indicator_cb.toggled.connect(self.on_rpm_toggle)
+        # clicked only fires on user interaction and carries the new state, so setChecked() needs no signal blocking
+        self.rpm_indicator_cb.clicked.connect(self.on_rpm_toggle)
         self.rpm_indicator_cb.setToolTip("Enable/disable RPM feedback from device")
         settings_layout.addWidget(self.rpm_indicator_cb, 1, 0, 1, 2)
         
         # Start When Powered checkbox
         self.start_powered_cb = QCheckBox("Start When Powered")
         self.start_powered_cb.setChecked(self.config_manager.load_setting("start_when_powered", "off") == "on")
-        self.start_powered_cb.toggled.connect(self.on_start_toggle)
+        self.start_powered_cb.clicked.connect(self.on_start_toggle)
         self.start_powered_cb.setToolTip("Automatically start when device is powered on")
         settings_layout.addWidget(self.start_powered_cb, 2, 0, 1, 2)
         
@@ -986,14 +740,13 @@ class BS2ProQtGUI(QMainWindow):
         rpm_row.addWidget(rpm_label)
         
         self.rpm_combo = QComboBox()
-        self.rpm_values = [1300, 1700, 1900, 2100, 2400, 2700]
-        self.rpm_combo.addItems([str(rpm) for rpm in self.rpm_values])
+        self.rpm_combo.addItems(RPM_STRINGS)
         self.rpm_combo.setMinimumWidth(100)
         self.rpm_combo.setMinimumHeight(24)  # Ensure proper height
         last_rpm = int(self.config_manager.load_setting("last_rpm", 1900))
         self.displayed_rpm = last_rpm  # Track what's currently displayed
         self.rpm_combo.setCurrentText(str(last_rpm))
-        self.rpm_combo.currentTextChanged.connect(self.on_rpm_select)
+        self.rpm_combo.textActivated.connect(self.on_rpm_select)
         self.rpm_combo.setToolTip("Choose fan RPM setting")
         self.rpm_combo.setMinimumWidth(120)
         self.rpm_combo.setStyleSheet("padding-left: 8px; padding-right: 8px;")  # Add left/right padding
@@ -1004,9 +757,7 @@ class BS2ProQtGUI(QMainWindow):
         
         # Current RPM display
         self.rpm_display_label = QLabel(f"Current: {last_rpm} RPM")
-        rpm_font = QFont()
-        rpm_font.setBold(True)
-        self.rpm_display_label.setFont(rpm_font)
+        self.rpm_display_label.setFont(bold_font())
         self.rpm_display_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.rpm_display_label.setStyleSheet("color: #1f538d; padding: 3px;")  # Reduced padding
         fan_layout.addWidget(self.rpm_display_label)
@@ -1073,9 +824,7 @@ class BS2ProQtGUI(QMainWindow):
         temp_info_layout = QVBoxLayout()
         
         self.temp_label = QLabel(f"{self.get_source_display_name()} Temperature: --°C")
-        temp_font = QFont()
-        temp_font.setBold(True)
-        self.temp_label.setFont(temp_font)
+        self.temp_label.setFont(bold_font())
         self.temp_label.setStyleSheet("color: #17a2b8; padding: 2px;")
         temp_info_layout.addWidget(self.temp_label)
         
@@ -1117,24 +866,61 @@ class BS2ProQtGUI(QMainWindow):
         
     def setup_monitoring(self):
         """Setup CPU and RPM monitoring"""
-        # Setup CPU monitoring callbacks
-        self.cpu_monitor.add_callback(self.on_temperature_changed)
+        # Setup CPU and RPM monitoring callbacks
+        self.temperature_pending.connect(self.flush_temperature)
+        self.cpu_monitor.add_callback(self.queue_temperature)
+        # RPM reports arrive on the monitor thread, the signal delivers them to on_rpm_update on the GUI thread
+        self.rpm_reported.connect(self.on_rpm_update)
+        self.controller.add_rpm_callback(self.rpm_reported.emit)
+        # Start the monitors once the event loop runs, their sensor and HID scans no longer delay the first paint
+        QTimer.singleShot(0, self.start_monitors)
+        
+        # Watch the config file to pick up external changes (e.g. from CLI commands). The directory is
+        # watched too because ConfigManager replaces the file on save, which drops the file watch
+        self.config_timer = None
+        config_file = self.config_manager.config_file
+        self.config_watcher = QFileSystemWatcher(self)
+        watching = self.config_watcher.addPath(os.path.dirname(os.path.abspath(config_file)))
+        self.config_watcher.addPath(config_file)
+        self.config_watcher.fileChanged.connect(self.on_config_file_changed)
+        self.config_watcher.directoryChanged.connect(self.on_config_file_changed)
+        if not watching:
+            # File watching unavailable, fall back to polling the config
+            self.config_timer = QTimer()
+            self.config_timer.timeout.connect(self.check_config_changes)
+            self.config_timer.start(1000)  # Check every second
+        
+        # Detect the device on a background thread, the GUI only redraws when the result changes
+        self.device_detected.connect(self.update_device_status)
+        self.device_poll_thread = threading.Thread(target=self.poll_device_status, daemon=True)
+        self.device_poll_thread.start()
+
+    def start_monitors(self):
+        """Start temperature and RPM monitoring (GUI thread, after the window is shown)"""
         self.cpu_monitor.start_monitoring()
-        
-        # Setup RPM monitoring callbacks
-        self.controller.add_rpm_callback(self.on_rpm_update)
         self.controller.start_rpm_monitoring()
+
+    def poll_device_status(self):
+        """Background loop keeping the detected device cached for the status display"""
+        while True:
+            try:
+                device = self.controller.get_detected_device()
+                if device != self._device_cache:
+                    self._device_cache = device
+                    self.device_detected.emit()
+            except Exception as e:
+                logging.error(f"Error polling device status: {e}")
+            if self._device_poll_stop.wait(DEVICE_POLL_INTERVAL):
+                return
         
-        # Setup config monitoring timer to detect external RPM changes
-        self.config_timer = QTimer()
-        self.config_timer.timeout.connect(self.check_config_changes)
-        self.config_timer.start(1000)  # Check every second
-        
-        # Setup device status monitoring timer
-        self.device_status_timer = QTimer()
-        self.device_status_timer.timeout.connect(self.update_device_status)
-        self.device_status_timer.start(1000)  # Check every second
-        
+    def on_config_file_changed(self, path):
+        """Re-check the config after the watcher saw it change"""
+        config_file = self.config_manager.config_file
+        if config_file not in self.config_watcher.files() and os.path.exists(config_file):
+            # The file was replaced, watch the new one
+            self.config_watcher.addPath(config_file)
+        self.check_config_changes()
+
     def check_config_changes(self):
         """Check for external config changes (e.g., from CLI commands)"""
         try:
@@ -1144,10 +930,9 @@ class BS2ProQtGUI(QMainWindow):
                 logging.warning(f"Detected RPM change from config: {self.displayed_rpm} -> {current_last_rpm}")
                 self.displayed_rpm = current_last_rpm
                 # Update the combo box and display
-                self.rpm_combo.blockSignals(True)  # Prevent triggering on_rpm_select
                 self.rpm_combo.setCurrentText(str(current_last_rpm))
-                self.rpm_combo.blockSignals(False)
                 self.rpm_display_label.setText(f"Current: {current_last_rpm} RPM")
+                self.displayed_device_rpm = None  # Let the next device report redraw the label
             
             # Check autostart changes
             current_autostart = self.config_manager.load_setting("autostart", "off")
@@ -1155,9 +940,7 @@ class BS2ProQtGUI(QMainWindow):
                 logging.warning(f"Detected autostart change from config: {self.displayed_autostart} -> {current_autostart}")
                 self.displayed_autostart = current_autostart
                 # Update the combo box
-                self.autostart_combo.blockSignals(True)
                 self.autostart_combo.setCurrentText(current_autostart.title())
-                self.autostart_combo.blockSignals(False)
             
             # Check RPM mode changes
             current_rpm_mode = self.config_manager.load_setting("rpm_mode", "off")
@@ -1165,9 +948,7 @@ class BS2ProQtGUI(QMainWindow):
                 logging.warning(f"Detected RPM mode change from config: {self.displayed_rpm_mode} -> {current_rpm_mode}")
                 self.displayed_rpm_mode = current_rpm_mode
                 # Update the checkbox
-                self.rpm_indicator_cb.blockSignals(True)
                 self.rpm_indicator_cb.setChecked(current_rpm_mode == "on")
-                self.rpm_indicator_cb.blockSignals(False)
             
             # Check start when powered changes
             current_start_powered = self.config_manager.load_setting("start_when_powered", "off")
@@ -1175,9 +956,7 @@ class BS2ProQtGUI(QMainWindow):
                 logging.warning(f"Detected start_when_powered change from config: {self.displayed_start_powered} -> {current_start_powered}")
                 self.displayed_start_powered = current_start_powered
                 # Update the checkbox
-                self.start_powered_cb.blockSignals(True)
                 self.start_powered_cb.setChecked(current_start_powered == "on")
-                self.start_powered_cb.blockSignals(False)
                 
         except Exception as e:
             logging.debug(f"Error checking config changes: {e}")
@@ -1188,8 +967,8 @@ class BS2ProQtGUI(QMainWindow):
             self.tray_icon = QSystemTrayIcon(self)
             
             # Set icon
-            if self.icon_path and os.path.exists(self.icon_path):
-                self.tray_icon.setIcon(QIcon(self.icon_path))
+            if self.app_icon:
+                self.tray_icon.setIcon(self.app_icon)
             else:
                 # Fallback icon
                 pixmap = QPixmap(16, 16)
@@ -1255,57 +1034,115 @@ class BS2ProQtGUI(QMainWindow):
         self.cleanup()
         QApplication.quit()
         
+    def debounce(self, key, func, *args):
+        """Run func(*args) after DEBOUNCE_MS, replacing a call still pending under the same key"""
+        timer = self._pending_timers.get(key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self.run_pending(key))
+            self._pending_timers[key] = timer
+        self._pending_calls[key] = lambda: func(*args)
+        timer.start(DEBOUNCE_MS)
+
+    def run_pending(self, key):
+        """Run the debounced call stored under key, if any"""
+        call = self._pending_calls.pop(key, None)
+        if call is not None:
+            call()
+
+    def flush_pending(self):
+        """Run all debounced calls immediately, e.g. before shutting down"""
+        for key, timer in list(self._pending_timers.items()):
+            timer.stop()
+            self.run_pending(key)
+
+    def save_setting(self, key, value):
+        """Queue a setting and schedule a single write for everything changed meanwhile"""
+        self.config_manager.defer_setting(key, value)
+        if not self._config_flush_timer.isActive():
+            self._config_flush_timer.start(CONFIG_FLUSH_MS)
+
+    def flush_config(self):
+        """Write queued settings to disk now"""
+        self._config_flush_timer.stop()
+        try:
+            self.config_manager.flush()
+        except OSError as e:
+            logging.error(f"Failed to save settings: {e}")
+
     # Event handlers
     def on_autostart_select(self, selected_value):
         """Handle autostart mode selection"""
-        cmd = self.commands[f"autostart_{selected_value.lower()}"]
-        success = self.controller.send_command(cmd, status_callback=self.create_status_callback())
-        self.config_manager.save_setting("autostart", selected_value.lower())
-        if not success:
-            self.update_status("Failed to set autostart mode", "#dc3545")
+        self.dispatch_setting("autostart", selected_value)
             
     def on_rpm_toggle(self, checked):
         """Handle RPM indicator toggle"""
-        cmd = self.commands["rpm_on"] if checked else self.commands["rpm_off"]
-        success = self.controller.send_command(cmd, status_callback=self.create_status_callback())
-        self.config_manager.save_setting("rpm_mode", "on" if checked else "off")
-        if not success:
-            self.update_status("Failed to toggle RPM indicator", "#dc3545")
+        self.dispatch_setting("rpm_mode", checked)
             
     def on_start_toggle(self, checked):
         """Handle start when powered toggle"""
-        success = True
-        status_callback = self.create_status_callback()
-        if checked:
-            success = self.controller.send_command(self.commands["startwhenpowered_on"], status_callback=status_callback)
-        else:
-            for cmd in self.commands["startwhenpowered_off"]:
-                if not self.controller.send_command(cmd, status_callback=status_callback):
-                    success = False
-        self.config_manager.save_setting("start_when_powered", "on" if checked else "off")
-        if not success:
-            self.update_status("Failed to toggle start when powered", "#dc3545")
+        self.dispatch_setting("start_when_powered", checked)
             
     def on_rpm_select(self, selected_value):
         """Handle RPM selection"""
-        rpm = int(selected_value)
-        success = self.controller.send_command(self.rpm_commands[rpm], status_callback=self.create_status_callback())
-        self.config_manager.save_setting("last_rpm", rpm)
-        if not success:
-            self.update_status(f"Failed to set RPM: {rpm}", "#dc3545")
+        self.dispatch_setting("last_rpm", selected_value)
+
+    def dispatch_setting(self, key, value):
+        """Debounce a settings change, apply_setting sends and saves the final value"""
+        self.debounce(key, self.apply_setting, key, value)
+
+    def apply_setting(self, key, value):
+        """Send the commands for a settings change and save it"""
+        resolve, failure_message = self.setting_actions[key]
+        cmds, saved_value = resolve(value)
+        # Re-selecting the saved value needs no device write, unless the last attempt failed
+        if key not in self.failed_settings and self.config_manager.load_setting(key) == saved_value:
+            return
+        self.send_async(cmds, lambda success: self.on_setting_sent(key, success),
+                        failure_message=failure_message.format(value))
+        self.save_setting(key, saved_value)
+
+    def on_setting_sent(self, key, success):
+        """Remember settings whose command failed so re-selecting them retries"""
+        if success:
+            self.failed_settings.discard(key)
+        else:
+            self.failed_settings.add(key)
             
     def on_rpm_update(self, rpm):
-        """Handle real-time RPM updates"""
+        """Handle real-time RPM updates (GUI thread)"""
         try:
+            # The device reports its speed on every poll, only redraw when it changed
+            if rpm == self.displayed_device_rpm:
+                return
+            self.displayed_device_rpm = rpm
             self.rpm_display_label.setText(f"Current: {rpm} RPM")
-            logging.info(f"RPM updated from device: {rpm}")
+            logging.debug("RPM updated from device: %s", rpm)
         except Exception as e:
             logging.error(f"Error updating RPM display: {e}")
             
+    def queue_temperature(self, temperature):
+        """Hand a temperature sample to the GUI thread, samples arriving before it runs are coalesced (monitor thread)"""
+        self._pending_temperature = temperature
+        if not self._temperature_scheduled:
+            self._temperature_scheduled = True
+            self.temperature_pending.emit()
+
+    def flush_temperature(self):
+        """Process the latest queued temperature sample (GUI thread)"""
+        # Clear the flag before reading, so a sample queued meanwhile schedules another flush
+        self._temperature_scheduled = False
+        self.on_temperature_changed(self._pending_temperature)
+
     def on_temperature_changed(self, temperature):
         """Handle temperature changes"""
-        source_name = self.get_source_display_name()
-        self.temp_label.setText(f"{source_name} Temperature: {temperature:.1f}°C")
+        # The label shows one decimal, only redraw it when that text changes
+        temp_key = round(temperature, 1)
+        if temp_key != self._displayed_temp_key:
+            self._displayed_temp_key = temp_key
+            source_name = self.get_source_display_name()
+            self.temp_label.setText(f"{source_name} Temperature: {temperature:.1f}°C")
         
         # Auto-adjust RPM if smart mode is enabled
         if self.smart_mode_manager.is_smart_mode_enabled():
@@ -1319,29 +1156,24 @@ class BS2ProQtGUI(QMainWindow):
             try:
                 ranges = self.smart_mode_manager.get_temperature_ranges()
                 if not ranges:
-                    self.smart_status_label.setText("Smart Mode: No temperature ranges configured")
-                    self.smart_status_label.setStyleSheet("color: #ffc107;")
+                    self.set_smart_status("Smart Mode: No temperature ranges configured", "#ffc107")
                     return
                 
                 current_temp = self.cpu_monitor.get_temperature()
                 if current_temp <= 0:
-                    self.smart_status_label.setText("Smart Mode: On - Waiting for temperature data")
-                    self.smart_status_label.setStyleSheet("color: #17a2b8;")
+                    self.set_smart_status("Smart Mode: On - Waiting for temperature data", "#17a2b8")
                     return
                 
-                self.smart_status_label.setText(f"Smart Mode: On - Monitoring {self.get_source_display_name()} temperature")
-                self.smart_status_label.setStyleSheet("color: #28a745;")
+                self.set_smart_status(f"Smart Mode: On - Monitoring {self.get_source_display_name()} temperature", "#28a745")
                 
-                # Auto-adjust with a small delay
-                QTimer.singleShot(100, lambda: self.auto_adjust_rpm(current_temp))
+                # Sending is asynchronous, so adjust right away
+                self.auto_adjust_rpm(current_temp)
                 
             except Exception as e:
                 logging.error(f"Error enabling smart mode: {e}")
-                self.smart_status_label.setText("Smart Mode: Error - Check configuration")
-                self.smart_status_label.setStyleSheet("color: #dc3545;")
+                self.set_smart_status("Smart Mode: Error - Check configuration", "#dc3545")
         else:
-            self.smart_status_label.setText("Smart Mode: Off")
-            self.smart_status_label.setStyleSheet("color: gray;")
+            self.set_smart_status("Smart Mode: Off", "gray")
             self.current_rpm = None
             
     def auto_adjust_rpm(self, temperature):
@@ -1353,82 +1185,72 @@ class BS2ProQtGUI(QMainWindow):
             # Validate target RPM
             if target_rpm is None or target_rpm < 1000 or target_rpm > 3000:
                 logging.warning(f"Invalid target RPM: {target_rpm}")
-                self.smart_status_label.setText("Smart Mode: Invalid RPM configuration")
-                self.smart_status_label.setStyleSheet("color: #dc3545;")
+                self.set_smart_status("Smart Mode: Invalid RPM configuration", "#dc3545")
                 return
             
             # Check if RPM command exists
             if target_rpm not in self.rpm_commands:
                 logging.warning(f"RPM command not found for {target_rpm}")
-                self.smart_status_label.setText("Smart Mode: RPM command not available")
-                self.smart_status_label.setStyleSheet("color: #dc3545;")
+                self.set_smart_status("Smart Mode: RPM command not available", "#dc3545")
                 return
             
             # Only change RPM if it's different from current
             if target_rpm != self.current_rpm:
                 self.current_rpm = target_rpm
                 
-                # Send command to device
-                success = self.controller.send_command(self.rpm_commands[target_rpm], status_callback=self.create_status_callback())
-                
-                if success:
-                    # Update combobox selection
-                    self.rpm_combo.setCurrentText(str(target_rpm))
-                    
-                    # Update smart status
-                    if range_info:
-                        self.smart_status_label.setText(f"Smart Mode: {range_info['description']} ({range_info['min_temp']}-{range_info['max_temp']}°C)")
-                        self.smart_status_label.setStyleSheet("color: #28a745;")
-                    else:
-                        self.smart_status_label.setText(f"Smart Mode: {target_rpm} RPM (Auto)")
-                        self.smart_status_label.setStyleSheet("color: #28a745;")
-                    
-                    # Save setting
-                    self.config_manager.save_setting("last_rpm", target_rpm)
-                else:
-                    self.smart_status_label.setText("Smart Mode: Failed to adjust RPM")
-                    self.smart_status_label.setStyleSheet("color: #dc3545;")
+                # Send command to device, the smart status is updated once the result is known
+                self.send_async([self.rpm_commands[target_rpm]],
+                                lambda success: self.on_smart_rpm_sent(target_rpm, range_info, success))
             else:
                 # RPM is already correct, just update status
-                if range_info:
-                    self.smart_status_label.setText(f"Smart Mode: {range_info['description']} ({range_info['min_temp']}-{range_info['max_temp']}°C)")
-                    self.smart_status_label.setStyleSheet("color: #28a745;")
-                else:
-                    self.smart_status_label.setText(f"Smart Mode: {target_rpm} RPM (Auto)")
-                    self.smart_status_label.setStyleSheet("color: #28a745;")
+                self.set_smart_status(self.smart_range_text(target_rpm, range_info), "#28a745")
                     
         except Exception as e:
             logging.error(f"Error in auto RPM adjustment: {e}")
-            self.smart_status_label.setText("Smart Mode: Error")
-            self.smart_status_label.setStyleSheet("color: #dc3545;")
+            self.set_smart_status("Smart Mode: Error", "#dc3545")
+
+    def on_smart_rpm_sent(self, target_rpm, range_info, success):
+        """Update the UI after a smart mode RPM command finished"""
+        if success:
+            # Update combobox selection, this does not re-send the command through on_rpm_select
+            self.rpm_combo.setCurrentText(str(target_rpm))
             
-    def open_smart_mode_config(self):
-        """Open the smart mode configuration dialog"""
-        try:
-            dialog = SmartModeConfigDialog(self, self.smart_mode_manager)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                # Configuration was saved, update status
-                self.update_status("Smart mode configuration updated", "#28a745")
-                # Refresh smart mode status if it's currently active
-                if self.smart_mode_cb.isChecked():
-                    self.on_temperature_changed(self.cpu_monitor.get_temperature())
-        except Exception as e:
-            logging.error(f"Error opening smart mode config: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to open configuration dialog: {e}")
-    
+            # Update smart status
+            self.set_smart_status(self.smart_range_text(target_rpm, range_info), "#28a745")
+            
+            # Save setting
+            self.save_setting("last_rpm", target_rpm)
+        else:
+            self.set_smart_status("Smart Mode: Failed to adjust RPM", "#dc3545")
+            
+    def smart_range_text(self, target_rpm, range_info):
+        """Return the smart status text for a range, formatted again only when the range or RPM changes"""
+        if range_info:
+            key = (range_info['description'], range_info['min_temp'], range_info['max_temp'])
+        else:
+            key = target_rpm
+        if key != self._smart_range_key:
+            self._smart_range_key = key
+            if range_info:
+                self._smart_range_text = f"Smart Mode: {range_info['description']} ({range_info['min_temp']}-{range_info['max_temp']}°C)"
+            else:
+                self._smart_range_text = f"Smart Mode: {target_rpm} RPM (Auto)"
+        return self._smart_range_text
+
+    def set_smart_status(self, text, color):
+        """Show a smart mode status, leaving the label alone when it already shows it"""
+        if (text, color) != self._smart_status:
+            self._smart_status = (text, color)
+            self.smart_status_label.setText(text)
+            self.smart_status_label.setStyleSheet(f"color: {color};")
+
     def on_temp_source_changed(self, source_text):
         """Handle temperature source selection change"""
-        source_map = {
-            "CPU": "cpu",
-            "GPU": "gpu", 
-            "Average": "average"
-        }
-        
-        source = source_map.get(source_text, "cpu")
+        source = self.SOURCE_KEYS.get(source_text, "cpu")
         self.cpu_monitor.set_source(source)
         
         # Save to config
-        self.config_manager.save_setting("temperature_source", source)
+        self.save_setting("temperature_source", source)
         
         # Update temperature display
         self.update_temperature_display()
@@ -1441,49 +1263,61 @@ class BS2ProQtGUI(QMainWindow):
         """Update the temperature display with current temperature"""
         current_temp = self.cpu_monitor.get_temperature()
         source_name = self.get_source_display_name()
+        self._displayed_temp_key = round(current_temp, 1)
         self.temp_label.setText(f"{source_name} Temperature: {current_temp:.1f}°C")
             
     def get_source_display_name(self):
         """Get display name for current temperature source"""
-        source_map = {
-            "cpu": "CPU",
-            "gpu": "GPU", 
-            "average": "Average"
-        }
-        
-        return source_map.get(self.cpu_monitor.source, "CPU")
+        return self.SOURCE_NAMES.get(self.cpu_monitor.source, "CPU")
             
     def open_smart_mode_config(self):
         """Open smart mode configuration dialog"""
-        dialog = SmartModeConfigDialog(self, self.smart_mode_manager)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        # Build the dialog (and its plot) once, later opens only reset it to the saved configuration
+        if self.smart_mode_dialog is None:
+            self.smart_mode_dialog = SmartModeConfigDialog(self, self.smart_mode_manager)
+        else:
+            self.smart_mode_dialog.reload()
+        if self.smart_mode_dialog.exec() == QDialog.DialogCode.Accepted:
             # Configuration was saved, update display
             logging.info("Smart mode configuration updated")
             
-    def create_status_callback(self):
-        """Create status callback for device operations"""
-        def status_callback(msg, style):
-            color_map = {
-                "success": "#28a745",
-                "danger": "#dc3545", 
-                "warning": "#ffc107",
-                "info": "#17a2b8",
-                "light": "#6c757d"
-            }
-            color = color_map.get(style, "#ffffff")
-            self.update_status(msg, color)
-            # Auto-reset status after 2 seconds
-            QTimer.singleShot(2000, self.update_device_status)
-        return status_callback
+    def show_command_status(self, msg, style):
+        """Show a device operation status message (GUI thread)"""
+        color = self.STATUS_COLORS.get(style, "#ffffff")
+        self.update_status(msg, color)
+        # Auto-reset status after 2 seconds, restarting the timer so overlapping messages reset once
+        self._status_reset_timer.start(STATUS_RESET_MS)
+
+    def send_async(self, hex_cmds, on_done=None, failure_message=None):
+        """Queue commands on the worker thread, on_done(success) runs on the GUI thread and failure_message is shown on failure"""
+        future = self.controller.send_commands_async(hex_cmds, status_callback=self.status_callback)
+        if on_done is not None or failure_message is not None:
+            future.add_done_callback(lambda f: self.command_finished(f, on_done, failure_message))
+
+    def command_finished(self, future, on_done, failure_message):
+        """Report a finished command future to the GUI thread (worker thread)"""
+        success = not future.cancelled() and future.exception() is None and bool(future.result())
+        if on_done is not None:
+            self.command_done.emit(on_done, success)
+        if not success and failure_message is not None:
+            self.command_failed.emit(failure_message)
+
+    def show_command_failure(self, message):
+        """Show the failure message of a settings command (GUI thread)"""
+        self.update_status(message, "#dc3545")
         
     def update_status(self, message, color):
         """Update status message with color"""
-        self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        # setStyleSheet re-polishes the label, skip it when the colour is unchanged
+        if message != self.status_label.text():
+            self.status_label.setText(message)
+        if color != self._status_color:
+            self._status_color = color
+            self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
         
     def update_device_status(self):
-        """Update device status display"""
-        vid, pid, device_path = self.controller.detect_bs2pro()
+        """Update device status display from the last background detection"""
+        vid, pid, device_path = self._device_cache
         if vid and pid:
             self.update_status(f"✅ BS2PRO detected (VID: {hex(vid)}, PID: {hex(pid)})", "#28a745")
         else:
@@ -1516,14 +1350,16 @@ class BS2ProQtGUI(QMainWindow):
             
     def cleanup(self):
         """Cleanup resources"""
+        # Changes made just before quitting still reach the device and the config file
+        self.flush_pending()
+        self.flush_config()
         if self.cpu_monitor:
             self.cpu_monitor.stop_monitoring()
         if self.controller:
-            self.controller.stop_rpm_monitoring()
+            self.controller.close()
         if hasattr(self, 'config_timer') and self.config_timer:
             self.config_timer.stop()
-        if hasattr(self, 'device_status_timer') and self.device_status_timer:
-            self.device_status_timer.stop()
+        self._device_poll_stop.set()
         if self.tray_icon:
             self.tray_icon.hide()
 
@@ -1549,10 +1385,7 @@ class SmartModeConfigDialog(QDialog):
         
         # Title
         title_label = QLabel("Fan Speed Configuration")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(bold_font(16))
         layout.addWidget(title_label)
         
         # Profile selection
@@ -1599,6 +1432,13 @@ class SmartModeConfigDialog(QDialog):
             logging.error(f"Error loading ranges: {e}")
             # Continue without loading ranges
             
+    def reload(self):
+        """Discard unsaved edits and show the saved configuration again"""
+        if self.smart_mode_manager.get_temperature_ranges():
+            self.load_ranges()
+        else:
+            self.graph_widget.clear_points()
+
     def create_graph_mode_widget(self):
         """Create the graph-based configuration widget"""
         widget = QWidget()
@@ -1799,11 +1639,10 @@ class SmartModeConfigDialog(QDialog):
         # RPM
         range_layout.addWidget(QLabel("RPM:"))
         rpm_combo = QComboBox()
-        rpm_values = [1300, 1700, 1900, 2100, 2400, 2700]  # Available RPM values
-        rpm_combo.addItems([str(rpm) for rpm in rpm_values])
+        rpm_combo.addItems(RPM_STRINGS)
         # Set current value or default to 1300
         current_rpm = str(range_data['rpm'])
-        if current_rpm in [str(rpm) for rpm in rpm_values]:
+        if current_rpm in RPM_STRINGS:
             rpm_combo.setCurrentText(current_rpm)
         else:
             rpm_combo.setCurrentText("1300")  # Default fallback
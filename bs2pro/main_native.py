@@ -18,13 +18,11 @@ try:
     # Try absolute imports first (for packaging)
     from bs2pro.controller import BS2ProController
     from bs2pro.config import ConfigManager
-    from bs2pro.gui_qt import create_qt_application  # PyQt6 GUI
     from bs2pro.udev_manager import UdevRulesManager
 except ImportError:
     # Fallback for development - try relative imports
     from controller import BS2ProController
     from config import ConfigManager
-    from gui_qt import create_qt_application  # PyQt6 GUI
     from udev_manager import UdevRulesManager
 
 RPM_COMMANDS = {
@@ -206,10 +204,7 @@ def handle_cli_args(controller, config_manager):
             cmd = COMMANDS[arg]
             success = True
             if isinstance(cmd, list):
-                for c in cmd:
-                    if not controller.send_command(c):
-                        success = False
-                        break
+                success = controller.send_commands(cmd)
             else:
                 success = controller.send_command(cmd)
             if success:
@@ -250,6 +245,18 @@ def handle_cli_args(controller, config_manager):
     
     return args.verbose
 
+def import_gui():
+    """Import the PyQt6 GUI entry point on demand"""
+    try:
+        from bs2pro.gui_qt import create_qt_application
+    except ImportError as e:
+        # Only fall back to the development layout when the package itself is missing,
+        # a missing PyQt6 must reach the caller unchanged
+        if e.name not in ("bs2pro", "bs2pro.gui_qt"):
+            raise
+        from gui_qt import create_qt_application
+    return create_qt_application
+
 def main():
     """Main entry point for the application"""
     controller = BS2ProController()
@@ -270,6 +277,8 @@ def main():
     # Start PyQt6 GUI
     try:
         logging.info("Starting PyQt6 GUI with native theming")
+        # Imported here so CLI commands never load PyQt6 and pyqtgraph
+        create_qt_application = import_gui()
         create_qt_application(controller, config_manager, RPM_COMMANDS, COMMANDS, DEFAULT_SETTINGS, ICON_PATH)
     except ImportError as e:
         print(f"❌ PyQt6 not available ({e}). Please install: sudo apt install python3-pyqt6")
@@ -8,30 +8,23 @@ import threading
 import time
 import struct
 
-# Try different ways to import hidapi
-try:
-    import hid
-except ImportError:
-    try:
-        import hidapi as hid
-    except ImportError:
-        hid = None
+# HID bindings and the open methods are shared with the controller, which imports them lazily
+if __package__:
+    from .controller import (BS2_PRODUCT_NEEDLE, FLYDIGI_MANUFACTURER_NEEDLE, FLYDIGI_VENDOR_IDS,
+                             _enumerate_cached, _get_hid, _get_hidapi, _open_hid, _read_hid_report)
+else:
+    from controller import (BS2_PRODUCT_NEEDLE, FLYDIGI_MANUFACTURER_NEEDLE, FLYDIGI_VENDOR_IDS,
+                            _enumerate_cached, _get_hid, _get_hidapi, _open_hid, _read_hid_report)
 
-# Try to import direct hidapi access
-HIDAPI_DIRECT = False
-try:
-    import hidapi
-    if hasattr(hidapi, 'hidapi') and hasattr(hidapi, 'ffi'):
-        HIDAPI_DIRECT = True
-        logging.debug("Direct hidapi access available")
-except ImportError:
-    logging.debug("Direct hidapi access not available")
+# Upper bound for a single report read while holding the shared device lock
+READ_TIMEOUT_MS = 100
 
 class RPMMonitor:
     def __init__(self):
         self.is_monitoring = False
         self.monitor_thread = None
-        self.callbacks = []
+        # Insertion-ordered registry, dict keys give O(1) add/remove
+        self.callbacks = {}
         self.current_rpm = 0
         self.device = None
         self.vid = None
@@ -40,44 +33,43 @@ class RPMMonitor:
         # Shared device access
         self.get_shared_device_func = None
         self.release_shared_device_func = None
+        self.device_lock = None
+        # Scratch buffer for direct hidapi reads
+        self._read_buffer = None
         
         
     def add_callback(self, callback):
         """Add a callback function to be called when RPM changes"""
-        self.callbacks.append(callback)
+        self.callbacks[callback] = None
     
     def remove_callback(self, callback):
         """Remove a callback function"""
-        if callback in self.callbacks:
-            self.callbacks.remove(callback)
+        self.callbacks.pop(callback, None)
     
-    def set_shared_device_access(self, get_func, release_func):
-        """Set shared device access functions"""
+    def set_shared_device_access(self, get_func, release_func, device_lock=None):
+        """Set shared device access functions and the lock guarding device I/O"""
         self.get_shared_device_func = get_func
         self.release_shared_device_func = release_func
+        self.device_lock = device_lock
     
     
     def _notify_callbacks(self, rpm):
         """Notify all registered callbacks of RPM change"""
-        for callback in self.callbacks:
+        # Iterate a snapshot, callbacks may be added or removed from another thread meanwhile
+        for callback in list(self.callbacks):
             try:
                 callback(rpm)
             except Exception as e:
-                logging.error(f"Error in RPM callback: {e}")
+                logging.error("Error in RPM callback: %s", e)
     
     def detect_bs2pro(self):
         """Detect BS2Pro device"""
-        if hid is None:
+        if _get_hid() is None:
             logging.error("HID library not available")
             return False
         
-        # Known Flydigi vendor IDs (can be extended if needed)
-        FLYDIGI_VENDOR_IDS = [
-            0x37d7,  # Flydigi vendor ID
-        ]
-        
         try:
-            devices = hid.enumerate()
+            devices = _enumerate_cached()
             for d in devices:
                 # Handle both dictionary-style and attribute-style access for different hidapi versions
                 product_string = ""
@@ -112,37 +104,37 @@ class RPMMonitor:
                 # 3. Manufacturer is "Flydigi" (fallback for any Flydigi device)
                 # 4. Vendor ID matches known Flydigi vendor IDs AND product contains "BS2"
                 
-                is_bs2_product = "BS2" in product_upper if product_upper else False
-                is_flydigi_manufacturer = "FLYDIGI" in manufacturer_upper if manufacturer_upper else False
+                is_bs2_product = BS2_PRODUCT_NEEDLE in product_upper if product_upper else False
+                is_flydigi_manufacturer = FLYDIGI_MANUFACTURER_NEEDLE in manufacturer_upper if manufacturer_upper else False
                 is_flydigi_vendor = vendor_id in FLYDIGI_VENDOR_IDS if vendor_id is not None else False
                 
                 # Primary detection: Product name contains "BS2"
                 if is_bs2_product:
                     self.vid = vendor_id
                     self.pid = product_id
-                    logging.info(f"BS2Pro found (by product name): VID={self.vid:04x}, PID={self.pid:04x}")
+                    logging.info("BS2Pro found (by product name): VID=%04x, PID=%04x", self.vid, self.pid)
                     return True
                 
                 # Secondary detection: Flydigi manufacturer + BS2 product
                 if is_flydigi_manufacturer and is_bs2_product:
                     self.vid = vendor_id
                     self.pid = product_id
-                    logging.info(f"BS2Pro found (by manufacturer + product): VID={self.vid:04x}, PID={self.pid:04x}")
+                    logging.info("BS2Pro found (by manufacturer + product): VID=%04x, PID=%04x", self.vid, self.pid)
                     return True
                 
                 # Tertiary detection: Flydigi vendor ID + BS2 product (when manufacturer string unavailable)
                 if is_flydigi_vendor and is_bs2_product:
                     self.vid = vendor_id
                     self.pid = product_id
-                    logging.info(f"BS2Pro found (by vendor ID + product): VID={self.vid:04x}, PID={self.pid:04x}")
+                    logging.info("BS2Pro found (by vendor ID + product): VID=%04x, PID=%04x", self.vid, self.pid)
                     return True
                 
                 # Last resort: Flydigi manufacturer only (very permissive, logs warning)
                 if is_flydigi_manufacturer:
                     self.vid = vendor_id
                     self.pid = product_id
-                    logging.warning(f"BS2Pro found (by manufacturer only - may be incorrect): "
-                                  f"VID={self.vid:04x}, PID={self.pid:04x}")
+                    logging.warning("BS2Pro found (by manufacturer only - may be incorrect): VID=%04x, PID=%04x",
+                                    self.vid, self.pid)
                     return True
                 
                 # Final fallback: Flydigi vendor ID only (when strings are empty/unavailable)
@@ -150,13 +142,13 @@ class RPMMonitor:
                 if is_flydigi_vendor and vendor_id is not None and product_id is not None:
                     self.vid = vendor_id
                     self.pid = product_id
-                    logging.info(f"BS2Pro found (by vendor ID only - strings unavailable): "
-                               f"VID={self.vid:04x}, PID={self.pid:04x}")
+                    logging.info("BS2Pro found (by vendor ID only - strings unavailable): VID=%04x, PID=%04x",
+                                 self.vid, self.pid)
                     return True
             
             return False
         except Exception as e:
-            logging.error(f"Error enumerating HID devices: {e}")
+            logging.error("Error enumerating HID devices: %s", e)
             return False
     
     def _open_device(self):
@@ -176,60 +168,13 @@ class RPMMonitor:
         if self.vid is None or self.pid is None:
             return False
             
-        try:
-            logging.info(f"Attempting to open HID device VID={self.vid:04x}, PID={self.pid:04x}")
-            
-            # Try different hidapi APIs, starting with most compatible
-            device_opened = False
-            
-            # Method 0: Try direct hidapi low-level access (most reliable)
-            if HIDAPI_DIRECT and not device_opened:
-                try:
-                    logging.info("Using direct hidapi low-level access")
-                    device_handle = hidapi.hidapi.hid_open(self.vid, self.pid, hidapi.ffi.NULL)
-                    if device_handle != hidapi.ffi.NULL:
-                        # Store handle in a way compatible with monitoring code
-                        self.device = {'handle': device_handle, 'type': 'direct'}
-                        device_opened = True
-                        logging.info("Device opened successfully with direct hidapi access")
-                except Exception as e:
-                    logging.debug(f"Direct hidapi access failed: {e}")
-            
-            # Method 1: Try hid.open() function first (most compatible)
-            if hasattr(hid, 'open') and not device_opened:
-                try:
-                    logging.info("Using hidapi open() function")
-                    self.device = hid.open(self.vid, self.pid)
-                    if self.device is not None:
-                        device_opened = True
-                        logging.info("Device opened successfully with open() function")
-                    else:
-                        logging.debug("hid.open() returned None")
-                except Exception as e:
-                    logging.debug(f"hid.open() failed: {e}")
-            
-            # Method 2: Try lowercase device() class
-            if hasattr(hid, 'device') and not device_opened:
-                try:
-                    logging.info("Using hidapi device() class")
-                    self.device = hid.device()
-                    self.device.open(self.vid, self.pid)
-                    device_opened = True
-                    logging.info("Device opened successfully with device() class")
-                except Exception as e:
-                    logging.debug(f"hid.device() failed: {e}")
-                    self.device = None
-            
-            # Skip Method 3 (Device class) as it's broken on this system
-            
-            if not device_opened:
-                logging.error("All HID device opening methods failed")
-                return False
-            
-            return True
-        except Exception as e:
-            logging.error(f"Error opening HID device: {e}")
+        logging.info("Attempting to open HID device VID=%04x, PID=%04x", self.vid, self.pid)
+        self.device, method_name = _open_hid(self.vid, self.pid, None)
+        if self.device is None:
+            logging.error("All HID device opening methods failed")
             return False
+        logging.info("Device opened successfully with %s", method_name)
+        return True
     
     def _close_device(self):
         """Close HID device"""
@@ -245,15 +190,14 @@ class RPMMonitor:
                 else:
                     # For direct devices, close them
                     if isinstance(self.device, dict) and self.device.get('type') == 'direct':
-                        if HIDAPI_DIRECT:
-                            hidapi.hidapi.hid_close(self.device['handle'])
-                            logging.debug("Direct hidapi device closed")
+                        _get_hidapi().hidapi.hid_close(self.device['handle'])
+                        logging.debug("Direct hidapi device closed")
                     elif hasattr(self.device, 'close'):
                         self.device.close()
                     self.device = None
                 logging.debug("HID device closed successfully")
             except Exception as e:
-                logging.error(f"Error closing HID device: {e}")
+                logging.error("Error closing HID device: %s", e)
         else:
             logging.debug("No device to close")
     
@@ -261,9 +205,9 @@ class RPMMonitor:
     def _decode_rpm_data(self, data):
         """Decode RPM data from HID report"""
         try:
-            # Convert bytes to hex string for analysis
-            hex_data = data.hex()
-            logging.info(f"Received data: {hex_data}")
+            # Only hex-encode the report when it will actually be logged
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("Received data: %s", data.hex())
             
             # Check if this is an echoed RPM command (starts with 5aa52605)
             # Pattern: 5aa52605[4 bytes RPM data]...
@@ -277,7 +221,7 @@ class RPMMonitor:
                     
                     # Validate RPM range
                     if 1000 <= rpm_value <= 3000:
-                        logging.info(f"Extracted RPM from echoed command: {rpm_value}")
+                        logging.info("Extracted RPM from echoed command: %s", rpm_value)
                         return rpm_value
                 
                 logging.info("Could not extract valid RPM from echoed command")
@@ -297,13 +241,13 @@ class RPMMonitor:
                     rpm_le = struct.unpack('<H', rpm_bytes)[0]
                     rpm_be = struct.unpack('>H', rpm_bytes)[0]
                     
-                    logging.info(f"Bytes 8-9: {rpm_bytes.hex()} -> LE: {rpm_le}, BE: {rpm_be}")
+                    logging.info("Bytes 8-9: %s -> LE: %s, BE: %s", rpm_bytes.hex(), rpm_le, rpm_be)
                     
                     if 1000 <= rpm_le <= 3000:  # Realistic fan RPM range
-                        logging.info(f"Found RPM (LE) at bytes 8-9: {rpm_le}")
+                        logging.info("Found RPM (LE) at bytes 8-9: %s", rpm_le)
                         return rpm_le
                     if 1000 <= rpm_be <= 3000:
-                        logging.info(f"Found RPM (BE) at bytes 8-9: {rpm_be}")
+                        logging.info("Found RPM (BE) at bytes 8-9: %s", rpm_be)
                         return rpm_be
                 
                 # Method 2: Look at bytes 10-11 (also common for 1300 RPM)
@@ -313,10 +257,10 @@ class RPMMonitor:
                     rpm_be = struct.unpack('>H', rpm_bytes)[0]
                     
                     if 1000 <= rpm_le <= 3000:
-                        logging.info(f"Found RPM (LE) at bytes 10-11: {rpm_le}")
+                        logging.info("Found RPM (LE) at bytes 10-11: %s", rpm_le)
                         return rpm_le
                     if 1000 <= rpm_be <= 3000:
-                        logging.info(f"Found RPM (BE) at bytes 10-11: {rpm_be}")
+                        logging.info("Found RPM (BE) at bytes 10-11: %s", rpm_be)
                         return rpm_be
                 
                 # Method 3: Look at bytes 13-14 (changing values that might be actual RPM)
@@ -326,10 +270,10 @@ class RPMMonitor:
                     rpm_be = struct.unpack('>H', rpm_bytes)[0]
                     
                     if 1000 <= rpm_le <= 3000:
-                        logging.info(f"Found RPM (LE) at bytes 13-14: {rpm_le}")
+                        logging.info("Found RPM (LE) at bytes 13-14: %s", rpm_le)
                         return rpm_le
                     if 1000 <= rpm_be <= 3000:
-                        logging.info(f"Found RPM (BE) at bytes 13-14: {rpm_be}")
+                        logging.info("Found RPM (BE) at bytes 13-14: %s", rpm_be)
                         return rpm_be
                 
                 # Method 4: Look at bytes 14-15 (scaled values)
@@ -344,10 +288,10 @@ class RPMMonitor:
                         scaled_be = rpm_be * scale
                         
                         if 1000 <= scaled_le <= 3000:
-                            logging.info(f"Found RPM (scaled LE x{scale}) at bytes 14-15: {scaled_le}")
+                            logging.info("Found RPM (scaled LE x%s) at bytes 14-15: %s", scale, scaled_le)
                             return scaled_le
                         if 1000 <= scaled_be <= 3000:
-                            logging.info(f"Found RPM (scaled BE x{scale}) at bytes 14-15: {scaled_be}")
+                            logging.info("Found RPM (scaled BE x%s) at bytes 14-15: %s", scale, scaled_be)
                             return scaled_be
                 
                 # No fallback methods - only use the accurate detection above
@@ -357,8 +301,34 @@ class RPMMonitor:
             return None
             
         except Exception as e:
-            logging.error(f"Error decoding RPM data: {e}")
+            logging.error("Error decoding RPM data: %s", e)
+            return None
+    
+    def _read_report(self, timeout_ms):
+        """Read one HID report from the open device, returns bytes or None on timeout"""
+        # Handle direct hidapi access
+        if isinstance(self.device, dict) and self.device.get('type') == 'direct':
+            hidapi = _get_hidapi()
+            # One buffer is reused for every poll, the report is copied out below
+            if self._read_buffer is None:
+                self._read_buffer = hidapi.ffi.new("unsigned char[]", 32)
+            response_buffer = self._read_buffer
+            bytes_read = hidapi.hidapi.hid_read_timeout(self.device['handle'], response_buffer, 32, timeout_ms)
+            if bytes_read < 0:
+                raise IOError("hid_read_timeout failed")
+            if bytes_read == 0:
+                return None
+            return bytes(hidapi.ffi.buffer(response_buffer, bytes_read))
+        
+        # Regular hidapi objects, read the same way as the controller so bindings
+        # without a timeout argument fall back to read(32) on the non-blocking handle
+        data = _read_hid_report(self.device, timeout_ms)
+        if not data:
             return None
+        # Convert list to bytes if necessary
+        if isinstance(data, list):
+            data = bytes(data)
+        return data
     
     def _monitor_loop(self, interval=0.1):
         """Main monitoring loop"""
@@ -387,105 +357,46 @@ class RPMMonitor:
                 
                 # Try to read data from the device
                 try:
-                    logging.debug("Attempting to read from device...")
-                    data = None
-                    
-                    # Handle direct hidapi access
-                    if isinstance(self.device, dict) and self.device.get('type') == 'direct':
-                        if HIDAPI_DIRECT:
-                            try:
-                                logging.debug("Trying read with direct hidapi access...")
-                                response_buffer = hidapi.ffi.new("unsigned char[]", 32)
-                                bytes_read = hidapi.hidapi.hid_read_timeout(self.device['handle'], response_buffer, 32, 1000)
-                                if bytes_read > 0:
-                                    data = bytes(hidapi.ffi.buffer(response_buffer, bytes_read))
-                                    logging.debug(f"Direct hidapi read completed, data: {data}")
-                                else:
-                                    logging.debug("No data received (direct hidapi timeout)")
-                            except Exception as e:
-                                logging.error(f"Direct hidapi read error: {e}")
-                                data = None
-                    
-                    # Handle regular hidapi objects
-                    elif hasattr(self.device, 'read'):
-                        try:
-                            logging.debug("Trying read without timeout...")
-                            data = self.device.read(32)  # No timeout parameter
-                            logging.debug(f"Read completed, data: {data}")
-                            if data:
-                                # Convert list to bytes if necessary
-                                if isinstance(data, list):
-                                    data = bytes(data)
-                                logging.debug(f"Raw data: {data.hex()}")
-                            else:
-                                logging.debug("No data received")
-                        except Exception as e:
-                            logging.error(f"Read error: {e}")
-                            data = None
-                    else:
+                    if not isinstance(self.device, dict) and not hasattr(self.device, 'read'):
                         logging.warning("Device has no read method")
                         time.sleep(interval)
                         continue
                     
+                    logging.debug("Attempting to read from device...")
+                    # Hold the device lock only for a bounded read so commands can interleave
+                    if self.device_lock is not None:
+                        with self.device_lock:
+                            # The shared handle may have been released while waiting for the lock
+                            if self.get_shared_device_func and self.get_shared_device_func() is not self.device:
+                                continue
+                            data = self._read_report(READ_TIMEOUT_MS)
+                    else:
+                        data = self._read_report(READ_TIMEOUT_MS)
+                    
                     if data:
                         # Data received, process it
-                        logging.debug(f"Data received: {len(data)} bytes")
+                        if logging.getLogger().isEnabledFor(logging.DEBUG):
+                            logging.debug("Raw data: %s", data.hex())
                         
                         rpm = self._decode_rpm_data(data)
                         if rpm is not None and rpm != self.current_rpm:
                             self.current_rpm = rpm
                             self._notify_callbacks(rpm)
-                            logging.info(f"RPM updated: {rpm}")
+                            logging.info("RPM updated: %s", rpm)
                     else:
-                        # No data received, try alternative approach
-                        logging.debug("No data received, trying alternative read method...")
-                        try:
-                            # Handle direct hidapi access for alternative read
-                            if isinstance(self.device, dict) and self.device.get('type') == 'direct':
-                                if HIDAPI_DIRECT:
-                                    response_buffer = hidapi.ffi.new("unsigned char[]", 32)
-                                    bytes_read = hidapi.hidapi.hid_read(self.device['handle'], response_buffer, 32)
-                                    if bytes_read > 0:
-                                        data = bytes(hidapi.ffi.buffer(response_buffer, bytes_read))
-                                        logging.debug(f"Raw data (direct hidapi no timeout): {data.hex()}")
-                                        rpm = self._decode_rpm_data(data)
-                                        if rpm is not None and rpm != self.current_rpm:
-                                            self.current_rpm = rpm
-                                            self._notify_callbacks(rpm)
-                                            logging.info(f"RPM updated: {rpm}")
-                            # Try reading without timeout for regular devices
-                            elif hasattr(self.device, 'read'):
-                                data = self.device.read(32)
-                                if data:
-                                    # Convert list to bytes if necessary
-                                    if isinstance(data, list):
-                                        data = bytes(data)
-                                    logging.debug(f"Raw data (no timeout): {data.hex()}")
-                                    rpm = self._decode_rpm_data(data)
-                                    if rpm is not None and rpm != self.current_rpm:
-                                        self.current_rpm = rpm
-                                        self._notify_callbacks(rpm)
-                                        logging.info(f"RPM updated: {rpm}")
-                        except Exception as e:
-                            logging.debug(f"Alternative read also failed: {e}")
+                        logging.debug("No data received")
                     
                 except Exception as e:
-                    logging.error(f"Error reading from device: {e}")
+                    logging.error("Error reading from device: %s", e)
                     # Device might have disconnected, try to reconnect
                     logging.info("Closing device due to read error")
                     self._close_device()
                     time.sleep(1)
                     
             except Exception as e:
-                logging.error(f"Error in monitoring loop: {e}")
+                logging.error("Error in monitoring loop: %s", e)
                 time.sleep(1)
             
-            # Release shared device after each read cycle
-            if self.release_shared_device_func and self.device:
-                self.release_shared_device_func()
-                self.device = None
-                logging.debug("Released shared device after RPM read")
-            
             time.sleep(interval)
         
         self._close_device()
@@ -493,7 +404,7 @@ class RPMMonitor:
     
     def start_monitoring(self, interval=0.1):
         """Start monitoring RPM data"""
-        logging.debug(f"start_monitoring called, is_monitoring: {self.is_monitoring}")
+        logging.debug("start_monitoring called, is_monitoring: %s", self.is_monitoring)
         if self.is_monitoring:
             logging.warning("RPM monitoring is already running")
             return
@@ -86,13 +86,14 @@ class SmartModeManager:
             
             # If delay period hasn't passed, keep current RPM
             if time_elapsed < self.rpm_change_delay:
-                logging.debug(f"RPM decrease delayed: {temperature}°C -> waiting {self.rpm_change_delay - time_elapsed:.1f}s more (pending: {self.pending_rpm_change})")
+                logging.debug("RPM decrease delayed: %s°C -> waiting %.1fs more (pending: %s)",
+                              temperature, self.rpm_change_delay - time_elapsed, self.pending_rpm_change)
                 # Update last temperature even during delay
                 self.last_temperature = temperature
                 return self.last_rpm
             else:
                 # Delay period has passed, apply the pending change
-                logging.debug(f"Applying delayed RPM change: {self.last_rpm} -> {self.pending_rpm_change}")
+                logging.debug("Applying delayed RPM change: %s -> %s", self.last_rpm, self.pending_rpm_change)
                 self.last_rpm = self.pending_rpm_change
                 self.pending_rpm_change = None
                 self.rpm_change_time = None
@@ -105,12 +106,13 @@ class SmartModeManager:
             abs(temperature - self.last_temperature) < 1.0 and 
             self.last_rpm is not None and
             self.pending_rpm_change is None):  # Don't apply hysteresis if we have a pending change
-            logging.debug(f"Temperature hysteresis: {temperature}°C -> keeping RPM {self.last_rpm} (last temp: {self.last_temperature}°C)")
+            logging.debug("Temperature hysteresis: %s°C -> keeping RPM %s (last temp: %s°C)",
+                          temperature, self.last_rpm, self.last_temperature)
             return self.last_rpm  # Keep the same RPM to prevent oscillation
         
         # Update last temperature
         self.last_temperature = temperature
-        logging.debug(f"Processing temperature change: {temperature}°C")
+        logging.debug("Processing temperature change: %s°C", temperature)
         
         # Calculate what the new RPM should be
         new_rpm = self._calculate_target_rpm(temperature)
@@ -122,7 +124,7 @@ class SmartModeManager:
         
         # If RPM is increasing (temperature going up), apply immediately for safety
         if new_rpm > self.last_rpm:
-            logging.debug(f"Temperature increase: {temperature}°C -> RPM {self.last_rpm} -> {new_rpm} (immediate)")
+            logging.debug("Temperature increase: %s°C -> RPM %s -> %s (immediate)", temperature, self.last_rpm, new_rpm)
             self.last_rpm = new_rpm
             # Cancel any pending decrease
             self.pending_rpm_change = None
@@ -135,12 +137,14 @@ class SmartModeManager:
             if self.pending_rpm_change is None:
                 self.pending_rpm_change = new_rpm
                 self.rpm_change_time = current_time
-                logging.debug(f"Temperature decrease: {temperature}°C -> RPM {self.last_rpm} -> {new_rpm} (delayed {self.rpm_change_delay}s)")
+                logging.debug("Temperature decrease: %s°C -> RPM %s -> %s (delayed %ss)",
+                              temperature, self.last_rpm, new_rpm, self.rpm_change_delay)
             # If we have a different pending change, update it
             elif self.pending_rpm_change != new_rpm:
                 self.pending_rpm_change = new_rpm
                 self.rpm_change_time = current_time
-                logging.debug(f"Updated pending RPM change: {temperature}°C -> RPM {self.last_rpm} -> {new_rpm} (delayed {self.rpm_change_delay}s)")
+                logging.debug("Updated pending RPM change: %s°C -> RPM %s -> %s (delayed %ss)",
+                              temperature, self.last_rpm, new_rpm, self.rpm_change_delay)
             
             # Keep current RPM until delay expires
             return self.last_rpm
@@ -11,6 +11,12 @@ setup(
         "PyQt6",
         "pyqtgraph",
     ],
+    extras_require={
+        # Invalidate device detection and cached sensor paths on udev hotplug events
+        "hotplug": ["pyudev"],
+        # NVIDIA GPU temperature through NVML instead of spawning nvidia-smi
+        "nvidia": ["nvidia-ml-py"],
+    },
     entry_points={
         "console_scripts": [
             "bs2pro=bs2pro.main_native:main"  # Updated to use new native main